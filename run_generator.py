@@ -2,8 +2,9 @@ import argparse
 import os
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from logging import getLogger
-from typing import List
+from typing import Optional, Tuple
 
 import yaml  # type: ignore
 from tqdm import tqdm
@@ -11,17 +12,70 @@ from tqdm import tqdm
 from src import (
     BuildFailedError,
     ComboGenerator,
+    CompiledConfig,
+    Config,
     ConfigValidator,
     DAGBuilderFactory,
     DAGExporter,
-    PropertySetterBase,
     PropertySetterFactory,
 )
 
 logger = getLogger(__name__)
 
 
-def main(config_path, dest_dir):
+def generate_combination(
+    dest_dir: str, dir_name: str, log: dict, config: Config
+) -> Tuple[int, int]:
+    # Re-seed so that the result does not depend on which process generates the combination.
+    config.set_random_seed()
+
+    combo_dest_dir = f"{dest_dir}/{dir_name}"
+    os.mkdir(combo_dest_dir)
+    with open(f"{combo_dest_dir}/combination_log.yaml", "w") as f:
+        yaml.dump(log, f)
+
+    # Compile config once for the builder, setters and exporter.
+    config = CompiledConfig(config)
+    dag_builder = DAGBuilderFactory().create_instance(config)
+    dag_iter = dag_builder.build()
+
+    property_plan = PropertySetterFactory.create_property_plan(config)
+
+    dag_exporter = DAGExporter(config)
+    # Loop for each dag.
+    for i, dag in enumerate(dag_iter):
+        try:
+            # Set all properties.
+            property_plan.set(dag)
+            # Export DAG.
+            dag_exporter.export(dag, combo_dest_dir, f"dag_{i}")
+        except BuildFailedError as e:
+            logger.warning(e.message)
+
+    return dag_builder.num_repaired_dags, dag_builder.num_resampled_dags
+
+
+# Base config shared by the combinations in a worker process (see '_init_worker').
+_worker_base_config: Optional[Config] = None
+
+
+def _init_worker(base_config: Config) -> None:
+    global _worker_base_config
+    _worker_base_config = base_config
+
+
+def _generate_combination_in_worker(dest_dir: str, dir_name: str, log: dict) -> Tuple[int, int]:
+    # Only the combination log is sent per task; the config is the overlay of the base config.
+    assert _worker_base_config is not None
+    return generate_combination(dest_dir, dir_name, log, _worker_base_config.overlay(log))
+
+
+def log_fixed_dags(dir_name: str, num_repaired: int, num_resampled: int) -> None:
+    if num_repaired or num_resampled:
+        logger.info(f"{dir_name}: {num_repaired} DAGs repaired, {num_resampled} DAGs resampled.")
+
+
+def main(config_path, dest_dir, jobs=1):
     with open(config_path) as f:
         config_raw = yaml.safe_load(f)
 
@@ -30,58 +84,30 @@ def main(config_path, dest_dir):
 
     # Generate combination.
     combo_gen = ComboGenerator(config_raw)
-    combo_iter = combo_gen.get_combo_iter()
     num_combo = combo_gen.get_num_combos()
+    progress_bar = tqdm(total=num_combo, desc="Generated combinations")
 
-    # Loop for each combination.
-    for dir_name, log, config in tqdm(combo_iter, total=num_combo, desc="Generated combinations"):
-        combo_dest_dir = f"{dest_dir}/{dir_name}"
-        os.mkdir(combo_dest_dir)
-        with open(f"{combo_dest_dir}/combination_log.yaml", "w") as f:
-            yaml.dump(log, f)
-
-        dag_builder = DAGBuilderFactory().create_instance(config)
-        dag_iter = dag_builder.build()
-
-        # ---- Create all setters ----
-        all_setter: List[PropertySetterBase] = []
-        # Create setters for utilization, period, execution time and communication time.
-        if config.multi_rate:
-            all_setter.append(PropertySetterFactory.create_utilization_setter(config))
-        elif config.execution_time:
-            all_setter.append(
-                PropertySetterFactory.create_random_setter(config, "Execution time", "node")
-            )
-        # HACK: RD-Gen assumes that 'Multi-rate' and 'CCR' are never specified at the same time.
-        #       If 'Multi-rate' and 'CCR' are specified at the same time,
-        #       the utilization rate is not protected.
-        if config.ccr:
-            all_setter.append(PropertySetterFactory.create_ccr_setter(config))
-        elif config.communication_time:
-            all_setter.append(
-                PropertySetterFactory.create_random_setter(config, "Communication time", "edge")
-            )
-        # Create setter for end-to-end deadline.
-        if config.end_to_end_deadline:
-            all_setter.append(PropertySetterFactory.create_deadline_setter(config))
-        # Create setter for offset.
-        if config.offset:
-            all_setter.append(PropertySetterFactory.create_random_setter(config, "Offset", "node"))
-        # Create setter for additional properties.
-        if config.additional_properties:
-            all_setter.append(PropertySetterFactory.create_additional_setter(config))
-
-        dag_exporter = DAGExporter(config)
-        # Loop for each dag.
-        for i, dag in enumerate(dag_iter):
-            try:
-                # Set all properties.
-                for setter in all_setter:
-                    setter.set(dag)
-                # Export DAG.
-                dag_exporter.export(dag, combo_dest_dir, f"dag_{i}")
-            except BuildFailedError as e:
-                logger.warning(e.message)
+    if jobs == 1:
+        # Loop for each combination.
+        for dir_name, log, config in combo_gen.get_combo_iter():
+            log_fixed_dags(dir_name, *generate_combination(dest_dir, dir_name, log, config))
+            progress_bar.update()
+    else:
+        # Each worker generates whole combinations, i.e., one combination directory per task.
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(combo_gen.base_config,),
+        ) as executor:
+            futures = {
+                executor.submit(_generate_combination_in_worker, dest_dir, dir_name, log): dir_name
+                for dir_name, log in combo_gen.get_combo_log_iter()
+            }
+            for future in as_completed(futures):
+                log_fixed_dags(futures[future], *future.result())
+                progress_bar.update()
+
+    progress_bar.close()
 
 
 def option_parser():
@@ -97,13 +123,22 @@ def option_parser():
         type=str,
         help="path to destination directory.",
     )
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        required=False,
+        default=1,
+        type=int,
+        help="number of worker processes generating combinations in parallel "
+        "(0: number of CPUs).",
+    )
     args = arg_parser.parse_args()
 
-    return args.config_path, args.dest_dir
+    return args.config_path, args.dest_dir, args.jobs or os.cpu_count() or 1
 
 
 if __name__ == "__main__":
-    config_path, dest_dir = option_parser()
+    config_path, dest_dir, jobs = option_parser()
 
     # Check whether config_path exists.
     if not os.path.isfile(config_path):
@@ -137,5 +172,5 @@ if __name__ == "__main__":
         os.mkdir(dest_dir)
 
     # Start generation.
-    main(config_path, dest_dir)
+    main(config_path, dest_dir, jobs)
     logger.info("Generation successfully completed.")
@@ -1,6 +1,6 @@
 from logging import DEBUG, Formatter, StreamHandler, getLogger
 
-from .config import ComboGenerator, Config, ConfigValidator
+from .config import ComboGenerator, CompiledConfig, Config, ConfigValidator
 from .dag_builder import DAGBuilderFactory
 from .dag_exporter import DAGExporter
 from .exceptions import BuildFailedError
@@ -9,6 +9,7 @@ from .property_setter import PropertySetterBase, PropertySetterFactory
 __all__ = [
     "ConfigValidator",
     "Config",
+    "CompiledConfig",
     "ComboGenerator",
     "DAGBuilderFactory",
     "PropertySetterBase",
@@ -1,3 +1,15 @@
+from .disjoint_set import DisjointSet
+from .min_degree_index import MinDegreeIndex
+from .node_pool import NodePool
+from .option_range import OptionRange
+from .reachability_index import ReachabilityIndex
 from .util import Util
 
-__all__ = ["Util"]
+__all__ = [
+    "Util",
+    "NodePool",
+    "MinDegreeIndex",
+    "ReachabilityIndex",
+    "DisjointSet",
+    "OptionRange",
+]
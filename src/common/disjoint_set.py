@@ -0,0 +1,138 @@
+from typing import Dict, Iterable, List
+
+import networkx as nx
+
+
+class DisjointSet:
+    """Disjoint set class.
+
+    Disjoint-set forest (union-find) with union by size and path halving.
+    It tracks the weakly connected components of a DAG
+    while edges are added during construction.
+
+    """
+
+    def __init__(self, elements: Iterable[int] = ()) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        elements : Iterable[int], optional
+            Initial elements, each of which forms a singleton set, by default ()
+
+        """
+        self._parent: Dict[int, int] = {}
+        self._size: Dict[int, int] = {}
+        self._num_sets = 0
+        for x in elements:
+            self.add(x)
+
+    @staticmethod
+    def from_graph(G: nx.DiGraph) -> "DisjointSet":
+        """Create disjoint set of the weakly connected components of a graph.
+
+        Parameters
+        ----------
+        G : nx.DiGraph
+            Graph.
+
+        Returns
+        -------
+        DisjointSet
+            Disjoint set whose sets are the weakly connected components of 'G'.
+
+        """
+        disjoint_set = DisjointSet(G.nodes)
+        for src_i, tgt_i in G.edges:
+            disjoint_set.union(src_i, tgt_i)
+
+        return disjoint_set
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def __contains__(self, x: int) -> bool:
+        return x in self._parent
+
+    @property
+    def number_of_sets(self) -> int:
+        return self._num_sets
+
+    def add(self, x: int) -> None:
+        """Add element as a singleton set.
+
+        Parameters
+        ----------
+        x : int
+            Element.
+
+        """
+        if x not in self._parent:
+            self._parent[x] = x
+            self._size[x] = 1
+            self._num_sets += 1
+
+    def find(self, x: int) -> int:
+        """Find representative of the set containing the element.
+
+        Parameters
+        ----------
+        x : int
+            Element.
+
+        Returns
+        -------
+        int
+            Representative.
+
+        """
+        parent = self._parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Merge the sets containing the two elements.
+
+        Parameters
+        ----------
+        x : int
+            Element.
+        y : int
+            Element.
+
+        Returns
+        -------
+        bool
+            True if the two sets were different and merged.
+
+        """
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+
+        if self._size[root_x] < self._size[root_y]:
+            root_x, root_y = root_y, root_x
+        self._parent[root_y] = root_x
+        self._size[root_x] += self._size.pop(root_y)
+        self._num_sets -= 1
+
+        return True
+
+    def get_sets(self) -> List[List[int]]:
+        """Get all sets.
+
+        Returns
+        -------
+        List[List[int]]
+            Elements of each set, in the order of first appearance.
+
+        """
+        sets: Dict[int, List[int]] = {}
+        for x in self._parent:
+            sets.setdefault(self.find(x), []).append(x)
+
+        return list(sets.values())
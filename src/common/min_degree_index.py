@@ -0,0 +1,179 @@
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+
+class MinDegreeIndex:
+    """Min-degree index class.
+
+    Bucket queue that groups nodes by degree.
+    Within a bucket, nodes are ordered by the order in which they were added to the index.
+    Therefore, 'get_min' follows the same "first minimum wins" rule
+    as 'Util.get_min_in_node' and 'Util.get_min_out_node'
+    when the nodes are added in the order of the option.
+
+    Notes
+    -----
+    Each bucket is a heap keyed by the order of addition,
+    and entries that became stale by 'update' or 'remove' are discarded lazily
+    when they reach the top of their bucket.
+    Therefore, 'add' and 'update' cost O(log k) for a bucket of k entries,
+    and 'get_min' costs O(1) amortized plus O(log k) per discarded entry.
+
+    Insertion-ordered buckets would make them O(1),
+    but they cannot keep the "first minimum wins" rule.
+    Degrees are updated in arbitrary order
+    (e.g., the source nodes of a fan-in are sampled at random),
+    so a node moved to a bucket may have to precede nodes already in the bucket.
+    The heap keeps the rule at logarithmic cost,
+    which is still far cheaper than the O(n) scan of 'Util.get_min_out_node'.
+
+    """
+
+    def __init__(self, degrees: Iterable[Tuple[int, int]] = ()) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        degrees : Iterable[Tuple[int, int]], optional
+            Pairs of (index of node, degree) in the order of priority, by default ()
+
+        """
+        self._buckets: List[List[Tuple[int, int]]] = []
+        self._degree: Dict[int, int] = {}
+        self._rank: Dict[int, int] = {}
+        self._next_rank = 0
+        self._min_degree = 0
+        for node_i, degree in degrees:
+            self.add(node_i, degree)
+
+    def __len__(self) -> int:
+        return len(self._degree)
+
+    def __contains__(self, node_i: int) -> bool:
+        return node_i in self._degree
+
+    def add(self, node_i: int, degree: int) -> None:
+        """Add node.
+
+        The added node has lower priority than all nodes already added.
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node.
+        degree : int
+            Degree of node.
+
+        Raises
+        ------
+        KeyError
+            'node_i' has already been added.
+
+        """
+        if node_i in self._degree:
+            raise KeyError(node_i)
+        self._rank[node_i] = self._next_rank
+        self._next_rank += 1
+        self._push(node_i, degree)
+
+    def remove(self, node_i: int) -> None:
+        """Remove node.
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node.
+
+        Raises
+        ------
+        KeyError
+            'node_i' is not in the index.
+
+        """
+        del self._degree[node_i]
+        del self._rank[node_i]
+
+    def update(self, node_i: int, degree: int) -> None:
+        """Update degree of node (increase-key and decrease-key).
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node.
+        degree : int
+            New degree of node.
+
+        Raises
+        ------
+        KeyError
+            'node_i' is not in the index.
+
+        """
+        if self._degree[node_i] != degree:
+            self._push(node_i, degree)
+
+    def increment(self, node_i: int, delta: int = 1) -> None:
+        """Add 'delta' to degree of node.
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node.
+        delta : int, optional
+            Amount of change, by default 1
+
+        """
+        self.update(node_i, self._degree[node_i] + delta)
+
+    def degree(self, node_i: int) -> int:
+        return self._degree[node_i]
+
+    def get_min(self) -> int:
+        """Get node with minimum degree.
+
+        Returns
+        -------
+        int
+            Index of the first node with minimum degree.
+
+        Raises
+        ------
+        ValueError
+            The index is empty.
+
+        """
+        if not self._degree:
+            raise ValueError("MinDegreeIndex is empty.")
+
+        while True:
+            bucket = self._buckets[self._min_degree]
+            while bucket:
+                rank, node_i = bucket[0]
+                if self._degree.get(node_i) == self._min_degree and self._rank[node_i] == rank:
+                    return node_i
+                heapq.heappop(bucket)  # Stale entry
+            self._min_degree += 1
+
+    def get_min_degree(self) -> int:
+        """Get minimum degree.
+
+        Returns
+        -------
+        int
+            Minimum degree.
+
+        Raises
+        ------
+        ValueError
+            The index is empty.
+
+        """
+        return self._degree[self.get_min()]
+
+    def _push(self, node_i: int, degree: int) -> None:
+        while len(self._buckets) <= degree:
+            self._buckets.append([])
+        heapq.heappush(self._buckets[degree], (self._rank[node_i], node_i))
+        self._degree[node_i] = degree
+        if degree < self._min_degree:
+            self._min_degree = degree
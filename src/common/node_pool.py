@@ -0,0 +1,82 @@
+import random
+from typing import Dict, Iterable, List
+
+
+class NodePool:
+    """Node pool class.
+
+    Set of node indices that supports O(1) addition, removal and random sampling.
+    The nodes are kept in a list together with their positions in it,
+    and a removed node is swapped with the last element before being popped.
+
+    """
+
+    def __init__(self, nodes: Iterable[int] = ()) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        nodes : Iterable[int], optional
+            Initial nodes, by default ()
+
+        """
+        self._nodes: List[int] = []
+        self._pos: Dict[int, int] = {}
+        for node_i in nodes:
+            self.add(node_i)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_i: int) -> bool:
+        return node_i in self._pos
+
+    def add(self, node_i: int) -> None:
+        """Add node.
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node to be added.
+
+        """
+        if node_i not in self._pos:
+            self._pos[node_i] = len(self._nodes)
+            self._nodes.append(node_i)
+
+    def remove(self, node_i: int) -> None:
+        """Remove node.
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node to be removed.
+
+        Raises
+        ------
+        KeyError
+            'node_i' is not in the pool.
+
+        """
+        pos = self._pos.pop(node_i)
+        last_i = self._nodes.pop()
+        if last_i != node_i:
+            self._nodes[pos] = last_i
+            self._pos[last_i] = pos
+
+    def sample(self, k: int) -> List[int]:
+        """Sample nodes at random without replacement.
+
+        Parameters
+        ----------
+        k : int
+            Number of nodes to be sampled.
+            If 'k' exceeds the size of the pool, all nodes are returned in random order.
+
+        Returns
+        -------
+        List[int]
+            Indices of sampled nodes.
+
+        """
+        return random.sample(self._nodes, min(k, len(self._nodes)))
@@ -0,0 +1,165 @@
+import decimal
+import math
+from collections.abc import Sequence
+from typing import Any, List, Union
+
+import numpy as np
+
+
+class OptionRange(Sequence):
+    """Option range class.
+
+    Lazy sequence of the values of a "(start, stop, step)" option.
+    It is equal to the list expanded by the previous 'ComboGenerator._convert_tuple_to_list'
+    (i.e., 'range' or 'np.arange' with rounding, plus 'stop' if it is on the grid),
+    but each value is computed on access, so its memory is O(1).
+
+    Notes
+    -----
+    If all of 'start', 'stop' and 'step' are integers, the values are int.
+    Otherwise, the i-th value is 'start' + i * (('start' + 'step') - 'start')
+    rounded to the number of decimal places of the arguments, as 'np.arange' computes it.
+
+    """
+
+    __slots__ = (
+        "_start",
+        "_stop",
+        "_step",
+        "_is_int",
+        "_num_grid",
+        "_delta",
+        "_decimals",
+        "_len",
+    )
+
+    def __init__(self, start: float, stop: float, step: float) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        start : float
+            Start of the range.
+        stop : float
+            End of the range (included if it is on the grid).
+        step : float
+            Step of the range.
+
+        """
+        self._start = start
+        self._stop = stop
+        self._step = step
+        self._is_int = (
+            float(start).is_integer() and float(stop).is_integer() and float(step).is_integer()
+        )
+        include_stop: bool
+        if self._is_int:
+            self._num_grid = len(range(int(start), int(stop), int(step)))
+            self._delta = int(step)
+            self._decimals = 0
+            include_stop = (stop - start) % step == 0
+        else:
+            self._num_grid = self._get_arange_len(start, stop, step)
+            self._delta = (start + step) - start
+            self._decimals = max(
+                self._get_num_decimal_places(start),
+                self._get_num_decimal_places(stop),
+                self._get_num_decimal_places(step),
+            )
+            m = self._decimals
+            include_stop = ((stop * (10**m)) - start * (10**m)) % (step * (10**m)) < 10**-10
+        self._len = self._num_grid + int(include_stop)
+
+    @staticmethod
+    def _get_arange_len(start: float, stop: float, step: float) -> int:
+        tmp_len = (stop - start) / step
+        if tmp_len == 0.0 and stop != start:
+            return 0 if math.copysign(1.0, tmp_len) < 0 else 1
+        return max(math.ceil(tmp_len), 0)
+
+    @staticmethod
+    def _get_num_decimal_places(n: float) -> int:
+        ctx = decimal.Context()
+        d = ctx.create_decimal(repr(n))
+        return len(format(d, "f").split(".")[1])
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:  # type: ignore
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("OptionRange index out of range")
+        if index == self._num_grid:
+            return int(self._stop) if self._is_int else self._stop
+        if self._is_int:
+            return int(self._start) + index * self._delta
+        if index == 1:
+            value = np.float64(self._start + self._step)
+        else:
+            value = np.float64(self._start) + index * self._delta
+
+        return float(np.round(value, self._decimals))
+
+    def __contains__(self, value: object) -> bool:
+        if not self._is_int or not isinstance(value, (int, np.integer)):
+            return super().__contains__(value)
+        offset = int(value) - int(self._start)
+        if offset % self._delta != 0:
+            return False
+        return 0 <= offset // self._delta < self._len
+
+    def take(self, indices: np.ndarray) -> List[Any]:
+        """Get values at indices at once.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Non-negative indices of values.
+
+        Returns
+        -------
+        List[Any]
+            Values at 'indices' as Python values.
+
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if self._is_int:
+            values = int(self._start) + indices * self._delta
+        else:
+            values = np.float64(self._start) + indices * self._delta
+            values[indices == 1] = self._start + self._step
+            values = np.round(values, self._decimals)
+        stop = int(self._stop) if self._is_int else self._stop
+        values = np.where(indices == self._num_grid, stop, values)
+
+        return values.tolist()
+
+    def min(self) -> Any:
+        return min(self[0], self[-1])
+
+    def max(self) -> Any:
+        return max(self[0], self[-1])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OptionRange):
+            return (self._start, self._stop, self._step) == (
+                other._start,
+                other._stop,
+                other._step,
+            )
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._start, self._stop, self._step))
+
+    def __repr__(self) -> str:
+        return f"OptionRange({self._start}, {self._stop}, {self._step})"
+
+    def __reduce__(self):
+        return (OptionRange, (self._start, self._stop, self._step))
@@ -0,0 +1,106 @@
+from typing import Dict, Iterable, List
+
+import networkx as nx
+
+
+class ReachabilityIndex:
+    """Reachability index class.
+
+    The ancestors and descendants of every node are kept as bitsets (Python int),
+    where the i-th bit corresponds to the i-th node of the DAG.
+    The bitsets are computed once in topological order
+    and updated incrementally as edges are added.
+
+    """
+
+    def __init__(self, G: nx.DiGraph) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        G : nx.DiGraph
+            DAG.
+
+        """
+        self._nodes: List[int] = list(G.nodes)
+        self._bit: Dict[int, int] = {node_i: 1 << i for i, node_i in enumerate(self._nodes)}
+        self._anc: Dict[int, int] = {}
+        self._desc: Dict[int, int] = {}
+
+        topological_order = list(nx.topological_sort(G))
+        for node_i in topological_order:
+            anc = 0
+            for pred_i in G.predecessors(node_i):
+                anc |= self._anc[pred_i] | self._bit[pred_i]
+            self._anc[node_i] = anc
+        for node_i in reversed(topological_order):
+            desc = 0
+            for succ_i in G.successors(node_i):
+                desc |= self._desc[succ_i] | self._bit[succ_i]
+            self._desc[node_i] = desc
+
+    def add_edge(self, src_i: int, tgt_i: int) -> None:
+        """Reflect an added edge.
+
+        Parameters
+        ----------
+        src_i : int
+            Index of source node of the edge.
+        tgt_i : int
+            Index of target node of the edge.
+
+        """
+        new_anc = self._anc[src_i] | self._bit[src_i]
+        new_desc = self._desc[tgt_i] | self._bit[tgt_i]
+        for node_i in self.to_nodes(new_desc):
+            self._anc[node_i] |= new_anc
+        for node_i in self.to_nodes(new_anc):
+            self._desc[node_i] |= new_desc
+
+    def ancestors(self, node_i: int) -> int:
+        """Get ancestors of node.
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node.
+
+        Returns
+        -------
+        int
+            Bitset of ancestors.
+
+        """
+        return self._anc[node_i]
+
+    def descendants(self, node_i: int) -> int:
+        """Get descendants of node.
+
+        Parameters
+        ----------
+        node_i : int
+            Index of node.
+
+        Returns
+        -------
+        int
+            Bitset of descendants.
+
+        """
+        return self._desc[node_i]
+
+    def to_bitset(self, nodes: Iterable[int]) -> int:
+        bitset = 0
+        for node_i in nodes:
+            bitset |= self._bit[node_i]
+
+        return bitset
+
+    def to_nodes(self, bitset: int) -> List[int]:
+        nodes = []
+        while bitset:
+            lowest = bitset & -bitset
+            nodes.append(self._nodes[lowest.bit_length() - 1])
+            bitset ^= lowest
+
+        return nodes
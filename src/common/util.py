@@ -3,6 +3,9 @@ import sys
 from typing import Any, Collection, List, Optional, Union
 
 import networkx as nx
+import numpy as np
+
+from .option_range import OptionRange
 
 
 class Util:
@@ -17,12 +20,40 @@ class Util:
         return param_name.lower().replace(" ", "_").replace("-", "_")
 
     @staticmethod
-    def random_choice(target: Union[Any, list]):
-        if isinstance(target, list):
+    def random_choice(target: Union[Any, list, OptionRange]):
+        if isinstance(target, (list, OptionRange)):
             return random.choice(target)
         else:
             return target
 
+    @staticmethod
+    def random_choices(target: Union[Any, list, OptionRange], k: int) -> list:
+        """Choose 'k' values at random with replacement.
+
+        The indices are drawn by a single call of 'np.random.randint',
+        and the chosen values keep their Python types.
+        The values of an OptionRange are computed from the indices at once.
+
+        Parameters
+        ----------
+        target : Union[Any, list, OptionRange]
+            Options. If not a list or an OptionRange, it is the only option.
+        k : int
+            Number of values.
+
+        Returns
+        -------
+        list
+            Chosen values.
+
+        """
+        if isinstance(target, list):
+            return [target[i] for i in np.random.randint(len(target), size=k)]
+        elif isinstance(target, OptionRange):
+            return target.take(np.random.randint(len(target), size=k))
+        else:
+            return [target] * k
+
     @staticmethod
     def true_or_false() -> bool:
         if random.choice([0, 1]) == 1:
@@ -39,18 +70,26 @@ class Util:
         return [v for v, d in dag.out_degree() if d == 0]
 
     @staticmethod
-    def get_option_min(option: Optional[Union[list, int, float]]) -> Optional[Union[int, float]]:
+    def get_option_min(
+        option: Optional[Union[list, OptionRange, int, float]]
+    ) -> Optional[Union[int, float]]:
         if option is None:
             return None
+        if isinstance(option, OptionRange):
+            return option.min()
         if isinstance(option, list):
             return min(option)
         else:
             return option
 
     @staticmethod
-    def get_option_max(option: Optional[Union[list, int, float]]) -> Optional[Union[int, float]]:
+    def get_option_max(
+        option: Optional[Union[list, OptionRange, int, float]]
+    ) -> Optional[Union[int, float]]:
         if option is None:
             return None
+        if isinstance(option, OptionRange):
+            return option.max()
         if isinstance(option, list):
             return max(option)
         else:
@@ -1,5 +1,14 @@
 from .combo_generator import ComboGenerator
+from .compiled_config import CompiledConfig, GenerationMethod, PeriodicType, UtilizationMethod
 from .config import Config
 from .config_validator import ConfigValidator
 
-__all__ = ["ConfigValidator", "ComboGenerator", "Config"]
+__all__ = [
+    "ConfigValidator",
+    "ComboGenerator",
+    "Config",
+    "CompiledConfig",
+    "GenerationMethod",
+    "PeriodicType",
+    "UtilizationMethod",
+]
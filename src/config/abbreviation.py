@@ -18,4 +18,5 @@ TO_ABB = {
     "sink node period": "EXP",
     "total utilization": "TU",
     "maximum utilization": "MU",
+    "maximum hyperperiod": "MH",
 }
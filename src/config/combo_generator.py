@@ -1,11 +1,8 @@
 import copy
-import decimal
 import itertools
-from typing import Dict, Generator, List, Tuple, Union
+from typing import Dict, Generator, List, Sequence, Tuple, Union
 
-import numpy as np
-
-from ..common import Util
+from ..common import OptionRange, Util
 from .abbreviation import TO_ABB
 from .config import Config
 
@@ -15,10 +12,17 @@ class ComboGenerator:
 
     def __init__(self, config_raw: dict) -> None:
         self._combo_params: List[str] = []
-        self._combo_values: List[Union[List[int], List[float]]] = []
+        self._combo_values: List[Sequence[Union[int, float]]] = []
         self._search_combo_and_format_tuple(config_raw["Graph structure"])
         self._search_combo_and_format_tuple(config_raw["Properties"])
         self._config = Config(config_raw)
+        self._base_config = copy.copy(self._config)
+        self._base_config.optimize()
+
+    @property
+    def base_config(self) -> Config:
+        """Optimized config which each combo_config overlays (see 'get_combo_iter')."""
+        return self._base_config
 
     def get_num_combos(self) -> int:
         """Get number of combinations.
@@ -55,19 +59,40 @@ class ComboGenerator:
                 Configuration in which the chosen value is stored
                 for the parameter specified as 'Combination'.
 
+        Notes
+        -----
+        The base config is copied and optimized only once.
+        Each combo_config is an overlay of the base config (see 'Config.overlay'),
+        so the parameters not specified as 'Combination' (e.g., long 'Random' lists)
+        are shared by all combinations and must not be modified in place.
+
         """
-        for i, combo in enumerate(itertools.product(*self._combo_values)):
-            combo_dir_name = self._create_combo_dir_name(combo, i) or "DAGs"  # type: ignore
-            combo_log = {}
-            combo_config = copy.deepcopy(self._config)
-            for k, v in zip(self._combo_params, combo):
-                combo_log[k] = v
-                combo_config.update_param_value(k, {"Fixed": v})
-            combo_config.optimize()
+        for combo_dir_name, combo_log in self.get_combo_log_iter():
+            combo_config = self._base_config.overlay(combo_log)
             combo_config.set_random_seed()
 
             yield (combo_dir_name, combo_log, combo_config)
 
+    def get_combo_log_iter(self) -> Generator[Tuple[str, dict], None, None]:
+        """Get iterator for combinations without building their configs.
+
+        Yields
+        ------
+        Generator[Tuple[str, dict], None, None]
+            (combo_dir_name, combo_log) (see 'get_combo_iter').
+
+        Notes
+        -----
+        The combo_config can be built later by 'base_config.overlay(combo_log)',
+        e.g., in the worker process that generates the combination.
+
+        """
+        for i, combo in enumerate(itertools.product(*self._combo_values)):
+            combo_dir_name = self._create_combo_dir_name(combo, i) or "DAGs"  # type: ignore
+            combo_log = dict(zip(self._combo_params, combo))
+
+            yield (combo_dir_name, combo_log)
+
     def _create_combo_dir_name(
         self,
         combo: Tuple[Union[int, float]],
@@ -104,7 +129,21 @@ class ComboGenerator:
         return combo_dir_name
 
     @staticmethod
-    def _convert_tuple_to_list(tuple_str: str) -> Union[List[int], List[float]]:
+    def _convert_tuple_to_range(tuple_str: str) -> OptionRange:
+        """Convert "(start, stop, step)" string to option range.
+
+        Parameters
+        ----------
+        tuple_str : str
+            "(start, stop, step)" string. The argument names can be specified
+            (e.g., "(start=1, stop=10, step=1)").
+
+        Returns
+        -------
+        OptionRange
+            Lazy sequence from 'start' to 'stop' (included if it is on the grid) by 'step'.
+
+        """
         tuple_str = tuple_str.replace("(", "")
         tuple_str = tuple_str.replace(")", "")
         tuple_str = tuple_str.replace(" ", "")
@@ -118,30 +157,7 @@ class ComboGenerator:
             elif i == 2 or "step" in arg:
                 args["step"] = float(arg.replace("step=", ""))
 
-        if args["start"].is_integer() and args["stop"].is_integer() and args["step"].is_integer():
-            # int case
-            converted = list(range(int(args["start"]), int(args["stop"]), int(args["step"])))
-            if (args["stop"] - args["start"]) % args["step"] == 0:
-                converted.append(int(args["stop"]))
-        else:
-            # float case
-            def get_num_decimal_places(n: float) -> int:
-                ctx = decimal.Context()
-                d = ctx.create_decimal(repr(n))
-                return len(format(d, "f").split(".")[1])
-
-            m = max(
-                get_num_decimal_places(args["start"]),
-                get_num_decimal_places(args["stop"]),
-                get_num_decimal_places(args["step"]),
-            )
-            converted = [round(n, m) for n in np.arange(**args)]  # type: ignore
-            if ((args["stop"] * (10**m)) - (args["start"]) * (10**m)) % (
-                args["step"] * (10**m)
-            ) < 10**-10:
-                converted.append(args["stop"])  # type: ignore
-
-        return converted
+        return OptionRange(args["start"], args["stop"], args["step"])
 
     def _search_combo_and_format_tuple(self, param_dict: dict) -> None:
         for k, v in param_dict.items():
@@ -149,9 +165,9 @@ class ComboGenerator:
                 if "Combination" in v.keys():
                     self._combo_params.append(k)
                     if isinstance(v["Combination"], str):
-                        v["Combination"] = self._convert_tuple_to_list(v["Combination"])  # format
+                        v["Combination"] = self._convert_tuple_to_range(v["Combination"])  # format
                     self._combo_values.append(v["Combination"])
                 elif "Random" in v.keys() and isinstance(v["Random"], str):
-                    v["Random"] = self._convert_tuple_to_list(v["Random"])
+                    v["Random"] = self._convert_tuple_to_range(v["Random"])
                 else:
                     self._search_combo_and_format_tuple(v)
@@ -0,0 +1,134 @@
+from enum import Enum
+from typing import Any, Dict, Union
+
+from ..common import Util
+from .config import Config
+
+
+class _OptionEnum(str, Enum):
+    """Base class of enums for string options in the config."""
+
+    @classmethod
+    def from_str(cls, s: str) -> "_OptionEnum":
+        """Get member matching string option.
+
+        Parameters
+        ----------
+        s : str
+            String option. Case and spaces are ignored (see 'Util.ambiguous_equals').
+
+        Returns
+        -------
+        _OptionEnum
+            Member whose value matches 's'.
+
+        Raises
+        ------
+        ValueError
+            No member matches 's'.
+
+        """
+        for member in cls:
+            if Util.ambiguous_equals(s, member.value):
+                return member
+        raise ValueError(f"'{s}' is not a valid {cls.__name__}.")
+
+
+class GenerationMethod(_OptionEnum):
+    FAN_IN_FAN_OUT = "Fan-in/fan-out"
+    G_N_P = "G(n, p)"
+    CHAIN_BASED = "Chain-based"
+
+
+class PeriodicType(_OptionEnum):
+    ALL = "All"
+    IO = "IO"
+    ENTRY = "Entry"
+    CHAIN = "Chain"
+
+
+class UtilizationMethod(_OptionEnum):
+    UUNIFAST = "UUniFast"
+    RAND_FIXED_SUM = "RandFixedSum"
+
+
+_ENUM_FIELDS = {
+    "generation_method": GenerationMethod,
+    "periodic_type": PeriodicType,
+    "utilization_method": UtilizationMethod,
+}
+
+
+class CompiledConfig:
+    """Compiled config class.
+
+    Immutable snapshot of a Config whose parameters are plain attributes
+    with the same names as the properties of Config.
+    Builders and setters read them without walking the raw config tree.
+
+    Notes
+    -----
+    - String options are converted to enums
+      ('generation_method', 'periodic_type' and 'utilization_method').
+    - Options are stored without 'Random' and 'Fixed' (see 'Config.optimize'),
+      even if the Config has not been optimized.
+
+    """
+
+    __slots__ = ("seed", "number_of_dags") + tuple(
+        name for name, attr in vars(Config).items() if isinstance(attr, property)
+    )
+
+    def __init__(self, config: Config) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        config : Config
+            Validated config.
+
+        """
+        for name in self.__slots__:
+            value = getattr(config, name, None)
+            if isinstance(value, dict) and value and set(value.keys()) <= {"Random", "Fixed"}:
+                value = list(value.values())[0]
+            if name in _ENUM_FIELDS and isinstance(value, str):
+                value = _ENUM_FIELDS[name].from_str(value)
+            object.__setattr__(self, name, value)
+
+    @staticmethod
+    def from_config(config: Union[Config, "CompiledConfig"]) -> "CompiledConfig":
+        """Compile config unless it is already compiled.
+
+        Parameters
+        ----------
+        config : Union[Config, CompiledConfig]
+            Config.
+
+        Returns
+        -------
+        CompiledConfig
+            Compiled config.
+
+        """
+        if isinstance(config, CompiledConfig):
+            return config
+        return CompiledConfig(config)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"CompiledConfig is immutable ('{name}' cannot be set).")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"CompiledConfig is immutable ('{name}' cannot be deleted).")
+
+    def __reduce__(self):
+        values = {name: getattr(self, name) for name in self.__slots__}
+        return (CompiledConfig._from_values, (values,))
+
+    @staticmethod
+    def _from_values(values: Dict[str, Any]) -> "CompiledConfig":
+        compiled = object.__new__(CompiledConfig)
+        for name, value in values.items():
+            object.__setattr__(compiled, name, value)
+
+        return compiled
@@ -1,5 +1,8 @@
+import copy
 import random
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
 
 from ..common import Util
 
@@ -22,10 +25,15 @@ class Config:
         self.graph_structure = config_raw["Graph structure"]
         self.properties = config_raw["Properties"]
         self.output_formats = config_raw["Output formats"]
+        self._overrides: Dict[str, Any] = {}
 
     def update_param_value(self, param_name: str, value: Any) -> None:
         """Update parameter value.
 
+        The dicts on the path to the parameter are copied and the rest are shared
+        (copy-on-write), so the dicts of the config this config was created from
+        (see 'overlay') are never modified.
+
         Parameters
         ----------
         param_name : str
@@ -34,20 +42,88 @@ class Config:
             Value to be set.
 
         """
-        property_name = Util.convert_to_property(param_name)
-        if hasattr(self, property_name):
-            object.__setattr__(self, property_name, value)
-        else:  # Additional properties
-            if self.node_properties and param_name in self.node_properties.keys():
-                self.node_properties[param_name] = value
-            elif self.edge_properties and param_name in self.edge_properties.keys():
-                self.edge_properties[param_name] = value
+        for attr_name in ["graph_structure", "properties"]:
+            updated = self._copy_on_write(getattr(self, attr_name), param_name, value)
+            if updated is not None:
+                setattr(self, attr_name, updated)
+                self._overrides = {**self._overrides, param_name: value}
+                break
+
+    def overlay(self, overrides: Dict[str, Any]) -> "Config":
+        """Create config overlaid with parameter values.
+
+        The created config shares all parameters not in 'overrides' with this config,
+        so it costs only the dicts on the paths to the overridden parameters.
+
+        Parameters
+        ----------
+        overrides : Dict[str, Any]
+            Parameter names and values to be set.
+
+        Returns
+        -------
+        Config
+            Overlaid config.
+
+        """
+        config = copy.copy(self)
+        for param_name, value in overrides.items():
+            config.update_param_value(param_name, value)
+
+        return config
+
+    @property
+    def overrides(self) -> Dict[str, Any]:
+        """Parameter names and values set by 'update_param_value' or 'overlay'."""
+        return self._overrides
+
+    def _set_param_value(self, attr_name: str, path: Tuple[str, ...], value: Any) -> None:
+        """Set parameter value at path by copy-on-write (see 'update_param_value').
+
+        Parameters
+        ----------
+        attr_name : str
+            'graph_structure' or 'properties'.
+        path : Tuple[str, ...]
+            Keys from the top of 'attr_name' to the parameter.
+        value : Any
+            Value to be set.
+
+        """
+        setattr(self, attr_name, self._copy_path(getattr(self, attr_name), path, value))
+        self._overrides = {**self._overrides, path[-1]: value}
+
+    @staticmethod
+    def _copy_path(param_dict: dict, path: Tuple[str, ...], value: Any) -> dict:
+        if len(path) == 1:
+            return {**param_dict, path[0]: value}
+        return {**param_dict, path[0]: Config._copy_path(param_dict[path[0]], path[1:], value)}
+
+    @staticmethod
+    def _copy_on_write(param_dict: dict, param_name: str, value: Any) -> Optional[dict]:
+        if param_name in param_dict:
+            return {**param_dict, param_name: value}
+        for k, v in param_dict.items():
+            if isinstance(v, dict):
+                updated = Config._copy_on_write(v, param_name, value)
+                if updated is not None:
+                    return {**param_dict, k: updated}
+
+        return None
 
     def set_random_seed(self) -> None:
         random.seed(self.seed)
+        np.random.seed(self.seed)
 
     def optimize(self) -> None:
-        """Remove 'Random' and 'Fixed'"""
+        """Remove 'Random' and 'Fixed'
+
+        The parameters are copied before the removal,
+        so the dicts shared with other configs (see 'overlay') are never modified.
+
+        """
+        self.graph_structure = copy.deepcopy(self.graph_structure)
+        self.properties = copy.deepcopy(self.properties)
         self._remove_random_fixed(self.graph_structure)
         self._remove_random_fixed(self.properties)
 
@@ -74,19 +150,23 @@ class Config:
 
     @number_of_nodes.setter
     def number_of_nodes(self, value):
-        self.graph_structure["Number of nodes"] = value
+        self._set_param_value("graph_structure", ("Number of nodes",), value)
 
     @property
     def ensure_weakly_connected(self):
         return self.graph_structure.get("Ensure weakly connected")
 
+    @property
+    def node_budgeting(self):
+        return self.graph_structure.get("Node budgeting")
+
     @property
     def out_degree(self):
         return self.graph_structure.get("Out-degree")
 
     @out_degree.setter
     def out_degree(self, value):
-        self.graph_structure["Out-degree"] = value
+        self._set_param_value("graph_structure", ("Out-degree",), value)
 
     @property
     def in_degree(self):
@@ -94,7 +174,7 @@ class Config:
 
     @in_degree.setter
     def in_degree(self, value):
-        self.graph_structure["In-degree"] = value
+        self._set_param_value("graph_structure", ("In-degree",), value)
 
     @property
     def probability_of_edge_existence(self):
@@ -102,7 +182,7 @@ class Config:
 
     @probability_of_edge_existence.setter
     def probability_of_edge_existence(self, value):
-        self.graph_structure["Probability of edge existence"] = value
+        self._set_param_value("graph_structure", ("Probability of edge existence",), value)
 
     @property
     def number_of_chains(self):
@@ -110,7 +190,7 @@ class Config:
 
     @number_of_chains.setter
     def number_of_chains(self, value):
-        self.graph_structure["Number of chains"] = value
+        self._set_param_value("graph_structure", ("Number of chains",), value)
 
     @property
     def main_sequence_length(self):
@@ -118,7 +198,7 @@ class Config:
 
     @main_sequence_length.setter
     def main_sequence_length(self, value):
-        self.graph_structure["Main sequence length"] = value
+        self._set_param_value("graph_structure", ("Main sequence length",), value)
 
     @property
     def number_of_sub_sequences(self):
@@ -126,7 +206,7 @@ class Config:
 
     @number_of_sub_sequences.setter
     def number_of_sub_sequences(self, value):
-        self.graph_structure["Number of sub sequences"] = value
+        self._set_param_value("graph_structure", ("Number of sub sequences",), value)
 
     @property
     def vertically_link_chains(self):
@@ -141,7 +221,9 @@ class Config:
 
     @main_sequence_tail.setter
     def main_sequence_tail(self, value):
-        self.graph_structure["Vertically link chains"]["Main sequence tail"] = value
+        self._set_param_value(
+            "graph_structure", ("Vertically link chains", "Main sequence tail"), value
+        )
 
     @property
     def sub_sequence_tail(self):
@@ -152,7 +234,9 @@ class Config:
 
     @sub_sequence_tail.setter
     def sub_sequence_tail(self, value):
-        self.graph_structure["Vertically link chains"]["Sub sequence tail"] = value
+        self._set_param_value(
+            "graph_structure", ("Vertically link chains", "Sub sequence tail"), value
+        )
 
     @property
     def number_of_source_nodes(self):
@@ -167,9 +251,11 @@ class Config:
     @number_of_source_nodes.setter
     def number_of_source_nodes(self, value):
         if Util.ambiguous_equals(self.generation_method, "chain-based"):
-            self.graph_structure["Vertically link chains"]["Number of source nodes"] = value
+            self._set_param_value(
+                "graph_structure", ("Vertically link chains", "Number of source nodes"), value
+            )
         else:
-            self.graph_structure["Number of source nodes"] = value
+            self._set_param_value("graph_structure", ("Number of source nodes",), value)
 
     @property
     def merge_chains(self):
@@ -184,7 +270,7 @@ class Config:
 
     @middle_of_chain.setter
     def middle_of_chain(self, value):
-        self.graph_structure["Merge chains"]["Middle of chain"] = value
+        self._set_param_value("graph_structure", ("Merge chains", "Middle of chain"), value)
 
     @property
     def sink_node(self):
@@ -195,7 +281,7 @@ class Config:
 
     @sink_node.setter
     def sink_node(self, value):
-        self.graph_structure["Merge chains"]["Sink node"] = value
+        self._set_param_value("graph_structure", ("Merge chains", "Sink node"), value)
 
     @property
     def number_of_sink_nodes(self):
@@ -210,9 +296,11 @@ class Config:
     @number_of_sink_nodes.setter
     def number_of_sink_nodes(self, value):
         if Util.ambiguous_equals(self.generation_method, "chain-based"):
-            self.graph_structure["Merge chains"]["Number of sink nodes"] = value
+            self._set_param_value(
+                "graph_structure", ("Merge chains", "Number of sink nodes"), value
+            )
         else:
-            self.graph_structure["Number of sink nodes"] = value
+            self._set_param_value("graph_structure", ("Number of sink nodes",), value)
 
     # ----- Properties -----
     @property
@@ -221,7 +309,7 @@ class Config:
 
     @execution_time.setter
     def execution_time(self, value):
-        self.properties["Execution time"] = value
+        self._set_param_value("properties", ("Execution time",), value)
 
     @property
     def communication_time(self):
@@ -229,7 +317,7 @@ class Config:
 
     @communication_time.setter
     def communication_time(self, value):
-        self.properties["Communication time"] = value
+        self._set_param_value("properties", ("Communication time",), value)
 
     @property
     def ccr(self):
@@ -237,7 +325,11 @@ class Config:
 
     @ccr.setter
     def ccr(self, value):
-        self.properties["CCR"] = value
+        self._set_param_value("properties", ("CCR",), value)
+
+    @property
+    def legacy_grouping(self):
+        return self.properties.get("Legacy grouping")
 
     @property
     def end_to_end_deadline(self):
@@ -252,7 +344,9 @@ class Config:
 
     @ratio_of_deadline_to_critical_path.setter
     def ratio_of_deadline_to_critical_path(self, value):
-        self.properties["End-to-end deadline"]["Ratio of deadline to critical path"] = value
+        self._set_param_value(
+            "properties", ("End-to-end deadline", "Ratio of deadline to critical path"), value
+        )
 
     @property
     def multi_rate(self):
@@ -267,7 +361,7 @@ class Config:
 
     @periodic_type.setter
     def periodic_type(self, value):
-        self.properties["Multi-rate"]["Periodic type"] = value
+        self._set_param_value("properties", ("Multi-rate", "Periodic type"), value)
 
     @property
     def period(self):
@@ -278,7 +372,7 @@ class Config:
 
     @period.setter
     def period(self, value):
-        self.properties["Multi-rate"]["Period"] = value
+        self._set_param_value("properties", ("Multi-rate", "Period"), value)
 
     @property
     def source_node_period(self):
@@ -289,7 +383,7 @@ class Config:
 
     @source_node_period.setter
     def source_node_period(self, value):
-        self.properties["Multi-rate"]["Source node period"] = value
+        self._set_param_value("properties", ("Multi-rate", "Source node period"), value)
 
     @property
     def sink_node_period(self):
@@ -300,7 +394,7 @@ class Config:
 
     @sink_node_period.setter
     def sink_node_period(self, value):
-        self.properties["Multi-rate"]["Sink node period"] = value
+        self._set_param_value("properties", ("Multi-rate", "Sink node period"), value)
 
     @property
     def offset(self):
@@ -311,7 +405,7 @@ class Config:
 
     @offset.setter
     def offset(self, value):
-        self.properties["Multi-rate"]["Offset"] = value
+        self._set_param_value("properties", ("Multi-rate", "Offset"), value)
 
     @property
     def total_utilization(self):
@@ -322,7 +416,7 @@ class Config:
 
     @total_utilization.setter
     def total_utilization(self, value):
-        self.properties["Multi-rate"]["Total utilization"] = value
+        self._set_param_value("properties", ("Multi-rate", "Total utilization"), value)
 
     @property
     def maximum_utilization(self):
@@ -333,7 +427,25 @@ class Config:
 
     @maximum_utilization.setter
     def maximum_utilization(self, value):
-        self.properties["Multi-rate"]["Maximum utilization"] = value
+        self._set_param_value("properties", ("Multi-rate", "Maximum utilization"), value)
+
+    @property
+    def utilization_method(self):
+        if self.multi_rate:
+            return self.properties["Multi-rate"].get("Utilization method")
+        else:
+            return None
+
+    @property
+    def maximum_hyperperiod(self):
+        if self.multi_rate:
+            return self.properties["Multi-rate"].get("Maximum hyperperiod")
+        else:
+            return None
+
+    @maximum_hyperperiod.setter
+    def maximum_hyperperiod(self, value):
+        self._set_param_value("properties", ("Multi-rate", "Maximum hyperperiod"), value)
 
     @property
     def additional_properties(self) -> Optional[dict]:
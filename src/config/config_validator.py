@@ -1,6 +1,7 @@
 import re
+from typing import Any
 
-from schema import Optional, Or, Regex, Schema
+from schema import Optional, Or, Regex, Schema, SchemaError
 
 from ..common import Util
 
@@ -40,6 +41,7 @@ class ConfigValidator:
                     {Regex("Random", flags=re.I): Or([float], str)},
                     {Regex("Combination", flags=re.I): Or([float], str)},
                 ),
+                Optional(Regex("Legacy grouping", flags=re.I)): bool,
                 Optional(Regex("End-to-end deadline", flags=re.I)): {
                     Regex("Ratio of deadline to critical path", flags=re.I): Or(
                         {Regex("Fixed", flags=re.I): float},
@@ -84,6 +86,15 @@ class ConfigValidator:
                         {Regex("Random", flags=re.I): Or([float], str)},
                         {Regex("Combination", flags=re.I): Or([float], str)},
                     ),
+                    Optional(Regex("Utilization method", flags=re.I)): Or(
+                        Regex("UUniFast", flags=re.I),
+                        Regex("RandFixedSum", flags=re.I),
+                    ),
+                    Optional(Regex("Maximum hyperperiod", flags=re.I)): Or(
+                        {Regex("Fixed", flags=re.I): int},
+                        {Regex("Random", flags=re.I): Or([int], str)},
+                        {Regex("Combination", flags=re.I): Or([int], str)},
+                    ),
                 },
                 Optional(Regex("Additional properties", flags=re.I)): {
                     Optional(Regex("Node properties", flags=re.I)): {
@@ -158,6 +169,7 @@ class ConfigValidator:
                     {Regex("Random", flags=re.I): Or([int], str)},
                     {Regex("Combination", flags=re.I): Or([int], str)},
                 ),
+                Optional(Regex("Node budgeting", flags=re.I)): bool,
             }
         },
         ignore_extra_keys=True,
@@ -226,14 +238,61 @@ class ConfigValidator:
         Check the entered configurations according to the schema.
         For detail, see https://www.andrewvillazon.com/validate-yaml-python-schema/.
 
+        Raises
+        ------
+        SchemaError
+            The config does not match the schema.
+
+        Notes
+        -----
+        The schema checks every element of a list (e.g., 'Random' and 'Combination').
+        To keep the validation time flat as lists grow,
+        each list whose elements all have the same type is first condensed to its first element,
+        which gives the same result (see '_condense').
+        Only if the condensed config is invalid,
+        the original config is validated to raise the error with the same message.
+
         """
-        self.base_schema.validate(self._config_raw)
-        gm = self._config_raw["Graph structure"]["Generation method"]
+        try:
+            self._validate(self._condense(self._config_raw))
+        except SchemaError:
+            self._validate(self._config_raw)
+
+    def _validate(self, config_raw: dict) -> None:
+        self.base_schema.validate(config_raw)
+        gm = config_raw["Graph structure"]["Generation method"]
         if Util.ambiguous_equals(gm, "fan-in/fan-out"):
-            self.fifo_gnp_common_schema.validate(self._config_raw)
-            self.fan_in_fan_out_schema.validate(self._config_raw)
+            self.fifo_gnp_common_schema.validate(config_raw)
+            self.fan_in_fan_out_schema.validate(config_raw)
         elif Util.ambiguous_equals(gm, "g(n, p)"):
-            self.fifo_gnp_common_schema.validate(self._config_raw)
-            self.g_n_p_schema.validate(self._config_raw)
+            self.fifo_gnp_common_schema.validate(config_raw)
+            self.g_n_p_schema.validate(config_raw)
         elif Util.ambiguous_equals(gm, "chain-based"):
-            self.chain_based_schema.validate(self._config_raw)
+            self.chain_based_schema.validate(config_raw)
+
+    @staticmethod
+    def _condense(value: Any) -> Any:
+        """Condense lists whose elements all have the same type.
+
+        A list schema (e.g., [int]) validates each element only by its type,
+        so a list whose elements all have the same type is valid
+        if and only if its first element is valid.
+        The types are compared in bulk by 'set(map(type, ...))'.
+
+        Parameters
+        ----------
+        value : Any
+            Value in the config.
+
+        Returns
+        -------
+        Any
+            Copy of 'value' in which such lists are replaced by their first element.
+            'value' itself is not modified.
+
+        """
+        if isinstance(value, dict):
+            return {k: ConfigValidator._condense(v) for k, v in value.items()}
+        if isinstance(value, list) and len(value) > 1 and len(set(map(type, value))) == 1:
+            return value[:1]
+        return value
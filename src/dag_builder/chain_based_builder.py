@@ -1,16 +1,25 @@
 import random
-from typing import Generator, List, Optional
+from typing import Generator, List, Optional, Tuple
 
 import networkx as nx
 
-from ..common import Util
+from ..common import MinDegreeIndex, ReachabilityIndex, Util
 from ..config import Config
 from ..exceptions import BuildFailedError, InfeasibleConfigError
 from .dag_builder_base import DAGBuilderBase
 
 
-class Chain(nx.DiGraph):
-    """Chain class."""
+class Chain:
+    """Chain class.
+
+    A chain is stored as compact index ranges instead of a graph.
+    The nodes of a chain are the contiguous indices from 'start_idx' to 'end_idx'.
+    The main sequence occupies the beginning of the range,
+    followed by each sub sequence.
+
+    """
+
+    __slots__ = ("start_idx", "end_idx", "main_tail", "sub_sequences")
 
     def __init__(self, start_idx: int) -> None:
         """Constructor.
@@ -21,10 +30,10 @@ class Chain(nx.DiGraph):
             Index of chain head.
 
         """
-        super().__init__()
         self.start_idx: int = start_idx
         self.end_idx: int
         self.main_tail: int
+        self.sub_sequences: List[Tuple[int, int, int]] = []  # (branch source, start, end)
 
     @property
     def head(self) -> int:
@@ -32,9 +41,23 @@ class Chain(nx.DiGraph):
 
     @property
     def sub_sequence_tails(self) -> List[int]:
-        tails = Util.get_sink_nodes(self)
-        tails.remove(self.main_tail)
-        return tails
+        return [end_i for _, _, end_i in self.sub_sequences]
+
+    @property
+    def nodes(self) -> range:
+        return range(self.start_idx, self.end_idx + 1)
+
+    @property
+    def edges(self) -> Generator[Tuple[int, int], None, None]:
+        main_seq = range(self.start_idx, self.main_tail + 1)
+        yield from zip(main_seq[:-1], main_seq[1:])
+        for src_i, start_i, end_i in self.sub_sequences:
+            yield (src_i, start_i)
+            sub_seq = range(start_i, end_i + 1)
+            yield from zip(sub_seq[:-1], sub_seq[1:])
+
+    def number_of_nodes(self) -> int:
+        return self.end_idx - self.start_idx + 1
 
     def build_chain(
         self,
@@ -53,26 +76,18 @@ class Chain(nx.DiGraph):
             Number of sub sequence, by default None
 
         """
-
-        def create_sequence(start_idx: int, len_sequence: int) -> None:
-            self.add_node(start_idx)
-            for i in range(start_idx, start_idx + len_sequence - 1):
-                self.add_edge(i, i + 1)
-
         # Build main sequence
-        main_seq_i = [i for i in range(self.start_idx, self.start_idx + main_sequence_length)]
-        self.main_tail = self.end_idx = main_seq_i[-1]
-        create_sequence(self.start_idx, main_sequence_length)
+        self.main_tail = self.end_idx = self.start_idx + main_sequence_length - 1
+        self.sub_sequences = []
 
         # Build sub sequence (Optional)
         if number_of_sub_sequence:
             for _ in range(number_of_sub_sequence):
-                src_i = random.choice(main_seq_i[:-1])
-                sub_seq_len = main_sequence_length - main_seq_i.index(src_i) - 1
+                src_i = random.randrange(self.start_idx, self.main_tail)
+                sub_seq_len = self.main_tail - src_i
                 sub_seq_start_idx = self.end_idx + 1
-                create_sequence(sub_seq_start_idx, sub_seq_len)
-                self.add_edge(src_i, sub_seq_start_idx)
                 self.end_idx = sub_seq_start_idx + sub_seq_len - 1
+                self.sub_sequences.append((src_i, sub_seq_start_idx, self.end_idx))
 
 
 class ChainBasedDAG(nx.DiGraph):
@@ -105,7 +120,7 @@ class ChainBasedDAG(nx.DiGraph):
 
         """
         # Determine source option
-        src_chains = set(random.sample(self.chains, number_of_source_nodes))
+        src_chains = random.sample(self.chains, number_of_source_nodes)
         src_option = []
         for chain in src_chains:
             if link_main_tail:
@@ -114,13 +129,15 @@ class ChainBasedDAG(nx.DiGraph):
                 src_option += chain.sub_sequence_tails
 
         # Determine targets
-        tgt_chains = set(self.chains) - src_chains
+        tgt_chains = [chain for chain in self.chains if chain not in src_chains]
         targets = [chain.head for chain in tgt_chains]
 
         # Add edges
+        src_index = MinDegreeIndex((src_i, self.out_degree(src_i)) for src_i in src_option)
         for tgt_i in targets:
-            src_i = Util.get_min_out_node(self, src_option)
+            src_i = src_index.get_min()
             self.add_edge(src_i, tgt_i)
+            src_index.increment(src_i)
 
     def merge_chains(
         self, number_of_sink_nodes: int, merge_middle: bool, merge_exit: bool
@@ -152,23 +169,18 @@ class ChainBasedDAG(nx.DiGraph):
         if not merge_middle:
             tgt_option = selected_exits
 
-        def anc(dag, src_i: int) -> set:
-            tmp = nx.DiGraph()
-            tmp.add_nodes_from(dag.nodes)
-            tmp.add_edges_from(dag.edges)
-            return nx.ancestors(tmp, src_i)
-
         # Add edges
-        copy_dag = nx.DiGraph()  # Use a copy because of a bug in nx.ancestor function.
-        copy_dag.add_nodes_from(self.nodes)
-        copy_dag.add_edges_from(self.edges)
+        reachability = ReachabilityIndex(self)
+        tgt_option_bits = reachability.to_bitset(tgt_option)
         for src_i in sources:
-            _tgt_option = tgt_option - nx.ancestors(copy_dag, src_i)
+            _tgt_option = reachability.to_nodes(
+                tgt_option_bits & ~reachability.ancestors(src_i)
+            )
             if not _tgt_option:
                 raise BuildFailedError("No merging is possible.")
             tgt_i = Util.get_min_in_node(self, _tgt_option)
             self.add_edge(src_i, tgt_i)
-            copy_dag.add_edge(src_i, tgt_i)
+            reachability.add_edge(src_i, tgt_i)
 
 
 class ChainBasedBuilder(DAGBuilderBase):
@@ -285,5 +297,6 @@ class ChainBasedBuilder(DAGBuilderBase):
                                 f"A DAG could not be built in {self._max_try} tries."
                             )
                         continue
+                break
 
             yield chain_based_dag
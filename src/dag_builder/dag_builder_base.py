@@ -1,10 +1,11 @@
+import random
 from abc import ABCMeta, abstractmethod
-from typing import Generator, List
+from typing import Generator, List, Optional, Tuple
 
 import networkx as nx
 
-from ..common import Util
-from ..config import Config
+from ..common import DisjointSet, MinDegreeIndex, Util
+from ..config import CompiledConfig, Config
 from ..exceptions import BuildFailedError
 
 
@@ -23,8 +24,20 @@ class DAGBuilderBase(metaclass=ABCMeta):
 
         """
         self._validate_config(config)
-        self._config = config
+        self._config = CompiledConfig.from_config(config)
         self._max_try = max_try
+        self._num_repaired_dags = 0
+        self._num_resampled_dags = 0
+
+    @property
+    def num_repaired_dags(self) -> int:
+        """Number of built DAGs whose size 1 components were repaired."""
+        return self._num_repaired_dags
+
+    @property
+    def num_resampled_dags(self) -> int:
+        """Number of built DAGs that were resampled from scratch at least once."""
+        return self._num_resampled_dags
 
     @abstractmethod
     def build(self) -> Generator[nx.DiGraph, None, None]:
@@ -35,7 +48,9 @@ class DAGBuilderBase(metaclass=ABCMeta):
         raise NotImplementedError
 
     @staticmethod
-    def _force_create_source_nodes(G: nx.DiGraph, number_of_source_nodes: int) -> None:
+    def _force_create_source_nodes(
+        G: nx.DiGraph, number_of_source_nodes: int, components: Optional[DisjointSet] = None
+    ) -> None:
         """Create an source node forcibly.
 
         Add 'number_of_source_nodes' number of new nodes to the DAG
@@ -48,15 +63,22 @@ class DAGBuilderBase(metaclass=ABCMeta):
             DAG.
         number_of_source_nodes : int
             Number of source nodes.
+        components : Optional[DisjointSet], optional
+            Weakly connected components of the DAG to be kept up to date, by default None
 
         """
         original_entries = Util.get_source_nodes(G)
         new_entries = [G.number_of_nodes() + i for i in range(number_of_source_nodes)]
         G.add_nodes_from(new_entries)
-        DAGBuilderBase._add_minimum_edges(new_entries, original_entries, G)
+        if components is not None:
+            for new_entry_i in new_entries:
+                components.add(new_entry_i)
+        DAGBuilderBase._add_minimum_edges(new_entries, original_entries, G, components)
 
     @staticmethod
-    def _force_create_sink_nodes(G: nx.DiGraph, number_of_sink_nodes: int) -> None:
+    def _force_create_sink_nodes(
+        G: nx.DiGraph, number_of_sink_nodes: int, components: Optional[DisjointSet] = None
+    ) -> None:
         """Create an sink node forcibly.
 
         Add 'number_of_sink_nodes' number of new nodes to the DAG
@@ -69,15 +91,25 @@ class DAGBuilderBase(metaclass=ABCMeta):
             DAG.
         number_of_sink_nodes : int
             Number of sink nodes.
+        components : Optional[DisjointSet], optional
+            Weakly connected components of the DAG to be kept up to date, by default None
 
         """
         original_exits = Util.get_sink_nodes(G)
         new_exits = [G.number_of_nodes() + i for i in range(number_of_sink_nodes)]
         G.add_nodes_from(new_exits)
-        DAGBuilderBase._add_minimum_edges(original_exits, new_exits, G)
+        if components is not None:
+            for new_exit_i in new_exits:
+                components.add(new_exit_i)
+        DAGBuilderBase._add_minimum_edges(original_exits, new_exits, G, components)
 
     @staticmethod
-    def _add_minimum_edges(src_layer: List[int], tgt_layer: List[int], G: nx.DiGraph) -> None:
+    def _add_minimum_edges(
+        src_layer: List[int],
+        tgt_layer: List[int],
+        G: nx.DiGraph,
+        components: Optional[DisjointSet] = None,
+    ) -> None:
         """Add minimum edges
 
         Connects the source and target layers with a minimum number of edges.
@@ -93,28 +125,36 @@ class DAGBuilderBase(metaclass=ABCMeta):
             Indices of nodes that are the target of the edge.
         G : nx.DiGraph
             DAG.
+        components : Optional[DisjointSet], optional
+            Weakly connected components of the DAG to be kept up to date, by default None
 
         """
-
-        def is_finish() -> bool:
-            for src_node_i in src_layer:
-                if G.out_degree(src_node_i) == 0:
-                    return False
-            for tgt_node_i in tgt_layer:
-                if G.in_degree(tgt_node_i) == 0:
-                    return False
-
-            return True
-
-        while not is_finish():
-            min_out_src_i = Util.get_min_out_node(G, src_layer)
-            min_in_tgt_i = Util.get_min_in_node(G, tgt_layer)
+        src_index = MinDegreeIndex((src_i, G.out_degree(src_i)) for src_i in src_layer)
+        tgt_index = MinDegreeIndex((tgt_i, G.in_degree(tgt_i)) for tgt_i in tgt_layer)
+        while src_index.get_min_degree() == 0 or tgt_index.get_min_degree() == 0:
+            min_out_src_i = src_index.get_min()
+            min_in_tgt_i = tgt_index.get_min()
             G.add_edge(min_out_src_i, min_in_tgt_i)
+            if components is not None:
+                components.union(min_out_src_i, min_in_tgt_i)
+            src_index.increment(min_out_src_i)
+            tgt_index.increment(min_in_tgt_i)
 
     @staticmethod
-    def _ensure_weakly_connected(G: nx.DiGraph, keep_num_entry: bool, keep_num_exit: bool) -> None:
+    def _ensure_weakly_connected(
+        G: nx.DiGraph,
+        keep_num_entry: bool,
+        keep_num_exit: bool,
+        components: Optional[DisjointSet] = None,
+    ) -> int:
         """Ensure weakly connected.
 
+        Each component other than the biggest one is connected to the biggest one by an edge.
+        If both the number of source nodes and the number of sink nodes are kept,
+        a size 1 component (i.e., a node both source and sink) cannot be connected by an edge.
+        Instead, it is repaired by moving an edge of the DAG to the node
+        (see '_repair_isolated_node').
+
         Parameters
         ----------
         G : nx.DiGraph
@@ -123,31 +163,150 @@ class DAGBuilderBase(metaclass=ABCMeta):
             Keep the number of source nodes.
         keep_num_exit : bool
             Keep the number of sink nodes.
+        components : Optional[DisjointSet], optional
+            Weakly connected components of the DAG maintained during construction,
+            by default None.
+            If None, the components are computed from the edges of the DAG.
+
+        Returns
+        -------
+        int
+            Number of repaired size 1 components.
 
         Raises
         ------
         BuildFailedError
             The number of source nodes and the number of sink nodes
-            cannot be kept because of the size 1 component.
+            cannot be kept because the DAG has no edge to move to a size 1 component.
 
         """
-        comps = list(nx.weakly_connected_components(G))
-        if len(comps) == 1:
-            return None
+        if components is None:
+            components = DisjointSet.from_graph(G)
+        if components.number_of_sets <= 1:
+            return 0
 
-        comps.sort(key=lambda x: len(x))
-        tgt_comp = comps.pop(-1)  # Most big component
+        comps = components.get_sets()
+        tgt_comp = max(comps, key=len)  # Most big component
 
-        source_nodes = set(Util.get_source_nodes(G))
-        sink_nodes = set(Util.get_sink_nodes(G))
-        if keep_num_entry and keep_num_exit and (source_nodes & sink_nodes):
-            raise BuildFailedError(
-                "The number of source nodes and the number of sink nodes"
-                "cannot be maintained because of the size 1 component."
-            )
+        # A size 1 component is the only component that has a node both source and sink.
+        isolated_nodes = []
+        if keep_num_entry and keep_num_exit:
+            isolated_nodes = [comp[0] for comp in comps if len(comp) == 1]
+            if isolated_nodes and len(tgt_comp) == 1:
+                raise BuildFailedError(
+                    "The number of source nodes and the number of sink nodes "
+                    "cannot be maintained because all components are size 1."
+                )
+        if keep_num_entry:
+            tgt_option = [tgt_i for tgt_i in tgt_comp if G.in_degree(tgt_i) != 0]
+        else:
+            tgt_option = tgt_comp
+        tgt_index = MinDegreeIndex((tgt_i, G.in_degree(tgt_i)) for tgt_i in tgt_option)
         for src_comp in comps:
-            src_option = src_comp - sink_nodes if keep_num_exit else src_comp
-            tgt_option = tgt_comp - source_nodes if keep_num_entry else tgt_comp
+            if src_comp is tgt_comp or (isolated_nodes and len(src_comp) == 1):
+                continue
+            if keep_num_exit:
+                src_option = [src_i for src_i in src_comp if G.out_degree(src_i) != 0]
+            else:
+                src_option = src_comp
             src_i = Util.get_min_out_node(G, src_option)
-            tgt_i = Util.get_min_in_node(G, tgt_option)
+            tgt_i = tgt_index.get_min()
             G.add_edge(src_i, tgt_i)
+            components.union(src_i, tgt_i)
+            tgt_index.increment(tgt_i)
+
+        # Repair size 1 components (Optional)
+        if isolated_nodes:
+            movable_edges = DAGBuilderBase._get_movable_edges(G)
+            for node_i in isolated_nodes:
+                neighbor_i = DAGBuilderBase._repair_isolated_node(G, node_i, movable_edges)
+                components.union(neighbor_i, node_i)
+
+        return len(isolated_nodes)
+
+    @staticmethod
+    def _get_movable_edges(G: nx.DiGraph) -> List[Tuple[int, int]]:
+        """Get edges that can be moved to isolated nodes (see '_repair_isolated_node').
+
+        An edge (u, v) is movable if v has no other in-edge or u has no other out-edge.
+        A spanning forest of the DAG is built by a disjoint set,
+        taking the edges that are not movable first,
+        and only the movable edges outside the forest are returned.
+        Since the forest is kept, all the returned edges can be moved
+        without splitting a weakly connected component.
+        Time is O(V + E).
+
+        Parameters
+        ----------
+        G : nx.DiGraph
+            DAG.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            Movable edges.
+
+        """
+        movable_edges: List[Tuple[int, int]] = []
+        forest = DisjointSet(G.nodes)
+        for src_i, tgt_i in G.edges():
+            if G.in_degree(tgt_i) == 1 or G.out_degree(src_i) == 1:
+                movable_edges.append((src_i, tgt_i))
+            else:
+                forest.union(src_i, tgt_i)
+
+        return [edge for edge in movable_edges if not forest.union(*edge)]
+
+    @staticmethod
+    def _repair_isolated_node(
+        G: nx.DiGraph, node_i: int, movable_edges: List[Tuple[int, int]]
+    ) -> int:
+        """Repair isolated node.
+
+        Connect a node both source and sink to the DAG
+        without changing the number of source nodes and the number of sink nodes.
+        A random edge (u, v) in 'movable_edges' is moved to the node as follows.
+        - If v has no other in-edge, (u, v) is replaced with (u, node).
+          v becomes a source node instead of the node.
+        - Otherwise, u has no other out-edge and (u, v) is replaced with (node, v).
+          u becomes a sink node instead of the node.
+        The move does not change whether the other edges in 'movable_edges' are movable,
+        so they are not checked again.
+
+        Parameters
+        ----------
+        G : nx.DiGraph
+            DAG.
+        node_i : int
+            Index of the node both source and sink.
+        movable_edges : List[Tuple[int, int]]
+            Edges returned by '_get_movable_edges'. The moved edge is removed from it.
+
+        Returns
+        -------
+        int
+            Index of the node connected to 'node_i'.
+
+        Raises
+        ------
+        BuildFailedError
+            No edge can be moved to the node.
+
+        """
+        if not movable_edges:
+            raise BuildFailedError(
+                "The number of source nodes and the number of sink nodes "
+                "cannot be maintained because no edge can be moved to an isolated node."
+            )
+
+        edge_i = random.randrange(len(movable_edges))
+        src_i, tgt_i = movable_edges[edge_i]
+        movable_edges[edge_i] = movable_edges[-1]
+        movable_edges.pop()
+        G.remove_edge(src_i, tgt_i)
+        if G.in_degree(tgt_i) == 0:
+            G.add_edge(src_i, node_i)
+            return src_i
+        else:
+            G.add_edge(node_i, tgt_i)
+            return tgt_i
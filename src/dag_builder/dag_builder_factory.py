@@ -1,5 +1,4 @@
-from ..common import Util
-from ..config import Config
+from ..config import Config, GenerationMethod
 from .chain_based_builder import ChainBasedBuilder
 from .dag_builder_base import DAGBuilderBase
 from .fan_in_fan_out_builder import FanInFanOutBuilder
@@ -34,12 +33,13 @@ class DAGBuilderFactory:
             Not implement.
 
         """
-        generation_method = config.generation_method
-        if Util.ambiguous_equals(generation_method, "fan-in/fan-out"):
+        try:
+            generation_method = GenerationMethod.from_str(config.generation_method)
+        except ValueError:
+            raise NotImplementedError
+        if generation_method == GenerationMethod.FAN_IN_FAN_OUT:
             return FanInFanOutBuilder(config)
-        elif Util.ambiguous_equals(generation_method, "g(n, p)"):
+        elif generation_method == GenerationMethod.G_N_P:
             return GNPBuilder(config)
-        elif Util.ambiguous_equals(generation_method, "chain-based"):
-            return ChainBasedBuilder(config)
         else:
-            raise NotImplementedError
+            return ChainBasedBuilder(config)
@@ -1,9 +1,9 @@
 import random
-from typing import Generator, Tuple
+from typing import Generator, Iterable, Tuple
 
 import networkx as nx
 
-from ..common import Util
+from ..common import DisjointSet, MinDegreeIndex, NodePool, Util
 from ..config import Config
 from ..exceptions import BuildFailedError, InfeasibleConfigError
 from .dag_builder_base import DAGBuilderBase
@@ -14,16 +14,8 @@ class FanInFanOutBuilder(DAGBuilderBase):
 
     def __init__(self, config: Config) -> None:
         super().__init__(config)
-        self._max_out = (
-            max(self._config.out_degree)
-            if isinstance(self._config.out_degree, list)
-            else self._config.out_degree
-        )
-        self._max_in = (
-            max(self._config.in_degree)
-            if isinstance(self._config.in_degree, list)
-            else self._config.in_degree
-        )
+        self._max_out = Util.get_option_max(self._config.out_degree)
+        self._max_in = Util.get_option_max(self._config.in_degree)
 
     def _validate_config(self, config: Config):
         """Validate config.
@@ -62,6 +54,15 @@ class FanInFanOutBuilder(DAGBuilderBase):
         BuildFailedError
             The number of build failures exceeded the maximum number of attempts.
 
+        Notes
+        -----
+        By default, a DAG that exceeds 'Number of nodes' after a fan-out is discarded
+        and rebuilt from scratch (rejection-based method).
+        If 'Node budgeting' is True, the number of nodes added by a fan-out is limited
+        to the remaining node budget, so each DAG is built in one pass.
+        This truncates the last fan-out instead of rejecting it,
+        which slightly shifts the distribution toward fewer edges.
+
         """
         for _ in range(self._config.number_of_dags):
             num_build_fail = 0
@@ -75,32 +76,36 @@ class FanInFanOutBuilder(DAGBuilderBase):
 
             # Initialize dag
             num_entry = Util.random_choice(self._config.number_of_source_nodes)
-            G = self._init_dag(num_entry)
+            G, pool, out_index, components = self._init_dag(num_entry)
 
             while G.number_of_nodes() != num_nodes:
                 if Util.true_or_false():
                     # Fan-out
-                    max_diff_node_i, diff = self._search_max_diff_node(G)
-                    num_add = random.randint(1, diff)
-                    add_node_i_list = [G.number_of_nodes() + i for i in range(num_add)]
-                    nx.add_star(G, [max_diff_node_i] + add_node_i_list)
+                    max_diff_node_i, diff = self._search_max_diff_node(out_index)
+                    if self._config.node_budgeting:
+                        diff = min(diff, num_nodes - G.number_of_nodes())
+                    # If the source nodes alone exceed the node budget,
+                    # no node is added and the DAG is counted as a build failure below.
+                    if diff > 0 or not self._config.node_budgeting:
+                        num_add = random.randint(1, diff)
+                        add_node_i_list = [G.number_of_nodes() + i for i in range(num_add)]
+                        nx.add_star(G, [max_diff_node_i] + add_node_i_list)
+                        self._update_indices(
+                            G, pool, out_index, components, [max_diff_node_i], add_node_i_list
+                        )
 
                 else:
                     # Fan-in
                     num_sources = random.randint(1, self._max_in)
-                    nodes = list(G.nodes())
-                    random.shuffle(nodes)
-                    sources = []
-                    for node_i in nodes:
-                        if G.out_degree(node_i) < self._max_out:
-                            sources.append(node_i)
-                            if len(sources) == num_sources:
-                                break
+                    sources = pool.sample(num_sources)
 
                     add_node_i = G.number_of_nodes()
                     G.add_node(add_node_i)
                     for source_node_i in sources:
                         G.add_edge(source_node_i, add_node_i)
+                    self._update_indices(
+                        G, pool, out_index, components, sources, [add_node_i]
+                    )
 
                 # Check build fail
                 if G.number_of_nodes() > num_nodes:
@@ -112,24 +117,30 @@ class FanInFanOutBuilder(DAGBuilderBase):
                         )
                         raise BuildFailedError(msg)
                     else:
-                        G = self._init_dag(num_entry)  # reset
+                        G, pool, out_index, components = self._init_dag(num_entry)  # reset
 
             # Add sink nodes (Optional)
             if num_exit:
-                self._force_create_sink_nodes(G, num_exit)
+                self._force_create_sink_nodes(G, num_exit, components)
 
             # Ensure weakly connected (Optional)
             if self._config.ensure_weakly_connected:
-                self._ensure_weakly_connected(G, True, bool(num_exit))
+                if self._ensure_weakly_connected(G, True, bool(num_exit), components):
+                    self._num_repaired_dags += 1
 
             yield G
 
-    def _search_max_diff_node(self, G: nx.DiGraph) -> Tuple[int, int]:
+    def _search_max_diff_node(self, out_index: MinDegreeIndex) -> Tuple[int, int]:
         """Search max difference node.
 
         Find the node with the biggest difference
         between its out-degree and max value of 'out-degree' parameter.
 
+        Parameters
+        ----------
+        out_index : MinDegreeIndex
+            Out-degree index of all nodes in the DAG.
+
         Returns
         -------
         Tuple[int, int]
@@ -137,14 +148,63 @@ class FanInFanOutBuilder(DAGBuilderBase):
             - Difference size
 
         """
-        min_out_i = Util.get_min_out_node(G, G.nodes)
-        max_diff = self._max_out - G.out_degree(min_out_i)
+        min_out_i = out_index.get_min()
+        max_diff = self._max_out - out_index.degree(min_out_i)
 
         return min_out_i, max_diff
 
-    def _init_dag(self, num_entry: int) -> nx.DiGraph:
+    def _init_dag(
+        self, num_entry: int
+    ) -> Tuple[nx.DiGraph, NodePool, MinDegreeIndex, DisjointSet]:
         G = nx.DiGraph()
         for _ in range(num_entry):
             G.add_node(G.number_of_nodes())
+        pool = NodePool()
+        out_index = MinDegreeIndex()
+        components = DisjointSet()
+        self._update_indices(G, pool, out_index, components, [], G.nodes)
+
+        return G, pool, out_index, components
+
+    def _update_indices(
+        self,
+        G: nx.DiGraph,
+        pool: NodePool,
+        out_index: MinDegreeIndex,
+        components: DisjointSet,
+        updated_nodes: Iterable[int],
+        added_nodes: Iterable[int],
+    ) -> None:
+        """Update the pool of nodes with spare out-degree, the out-degree index and components.
+
+        A fan-out and a fan-in add an edge between every updated node and every added node.
 
-        return G
+        Parameters
+        ----------
+        G : nx.DiGraph
+            DAG.
+        pool : NodePool
+            Pool of nodes whose out-degree is less than max value of 'Out-degree' parameter.
+        out_index : MinDegreeIndex
+            Out-degree index of all nodes in the DAG.
+        components : DisjointSet
+            Weakly connected components of the DAG.
+        updated_nodes : Iterable[int]
+            Indices of nodes whose out-degree has increased.
+        added_nodes : Iterable[int]
+            Indices of newly added nodes.
+
+        """
+        for node_i in updated_nodes:
+            out_degree = G.out_degree(node_i)
+            out_index.update(node_i, out_degree)
+            if node_i in pool and out_degree >= self._max_out:
+                pool.remove(node_i)
+        for node_i in added_nodes:
+            out_degree = G.out_degree(node_i)
+            out_index.add(node_i, out_degree)
+            if out_degree < self._max_out:
+                pool.add(node_i)
+            components.add(node_i)
+            for updated_node_i in updated_nodes:
+                components.union(updated_node_i, node_i)
@@ -1,10 +1,10 @@
-import random
 from logging import getLogger
-from typing import Generator
+from typing import Generator, Optional, Tuple
 
 import networkx as nx
+import numpy as np
 
-from ..common import Util
+from ..common import DisjointSet, Util
 from ..config import Config
 from ..exceptions import BuildFailedError, InfeasibleConfigError
 from .dag_builder_base import DAGBuilderBase
@@ -74,34 +74,155 @@ class GNPBuilder(DAGBuilderBase):
 
                 # Initialize DAG
                 G = nx.DiGraph()
-                for i in range(num_nodes):
-                    G.add_node(G.number_of_nodes())
+                G.add_nodes_from(range(num_nodes))
+                components = (
+                    DisjointSet(G.nodes) if self._config.ensure_weakly_connected else None
+                )
 
                 # Add edge
                 prob_edge = Util.random_choice(self._config.probability_of_edge_existence)
-                for i in range(num_nodes):
-                    for j in range(num_nodes):
-                        if random.randint(1, 100) < prob_edge * 100 and i < j:
-                            G.add_edge(i, j)
+                self._add_random_edges(G, num_nodes, prob_edge, components)
 
                 # Add source nodes (Optional)
                 if num_entry:
-                    self._force_create_source_nodes(G, num_entry)
+                    self._force_create_source_nodes(G, num_entry, components)
 
                 # Add sink nodes (Optional)
                 if num_exit:
-                    self._force_create_sink_nodes(G, num_exit)
+                    self._force_create_sink_nodes(G, num_exit, components)
 
                 # Ensure weakly connected (Optional)
                 if self._config.ensure_weakly_connected:
                     try:
-                        self._ensure_weakly_connected(G, bool(num_entry), bool(num_exit))
-                        break
+                        if self._ensure_weakly_connected(
+                            G, bool(num_entry), bool(num_exit), components
+                        ):
+                            self._num_repaired_dags += 1
                     except BuildFailedError:
                         if try_i == self._max_try:
                             raise BuildFailedError(
                                 f"A DAG could not be built in {self._max_try} tries."
                             )
                         continue
+                break
+
+            if try_i > 1:
+                self._num_resampled_dags += 1
 
             yield G
+
+    @staticmethod
+    def _add_random_edges(
+        G: nx.DiGraph,
+        num_nodes: int,
+        prob_edge: float,
+        components: Optional[DisjointSet] = None,
+    ) -> None:
+        """Add edges based on G(n, p) method.
+
+        Each pair (i, j) with i < j is connected independently with probability 'prob_edge'.
+        The sampled edges are added in bulk.
+
+        Parameters
+        ----------
+        G : nx.DiGraph
+            DAG whose nodes are 0, 1, ..., 'num_nodes' - 1.
+        num_nodes : int
+            Number of nodes.
+        prob_edge : float
+            Probability of edge existence.
+        components : Optional[DisjointSet], optional
+            Weakly connected components of the DAG to be kept up to date, by default None
+
+        Notes
+        -----
+        If 'prob_edge' < 0.5, the sparse mode ('_sample_edges_sparse') is used.
+        Otherwise, the dense mode ('_sample_edges_dense') is used.
+        Both modes produce the same graph distribution.
+
+        """
+        if prob_edge < 0.5:
+            src, tgt = GNPBuilder._sample_edges_sparse(num_nodes, prob_edge)
+        else:
+            src, tgt = GNPBuilder._sample_edges_dense(num_nodes, prob_edge)
+        edges = list(zip(src.tolist(), tgt.tolist()))
+        G.add_edges_from(edges)
+        if components is not None:
+            for src_i, tgt_i in edges:
+                components.union(src_i, tgt_i)
+
+    @staticmethod
+    def _sample_edges_dense(num_nodes: int, prob_edge: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample edges in dense mode.
+
+        All pairs in the strict upper triangle are sampled in one vectorized Bernoulli draw.
+        Time and memory are O(n^2).
+
+        Parameters
+        ----------
+        num_nodes : int
+            Number of nodes.
+        prob_edge : float
+            Probability of edge existence.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            (src, tgt)
+            - src: Indices of source nodes of the edges.
+            - tgt: Indices of target nodes of the edges.
+
+        """
+        src, tgt = np.triu_indices(num_nodes, k=1)
+        exist = np.random.random_sample(src.size) < prob_edge
+        return src[exist], tgt[exist]
+
+    @staticmethod
+    def _sample_edges_sparse(num_nodes: int, prob_edge: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample edges in sparse mode.
+
+        The pairs in the strict upper triangle are enumerated in row-major order,
+        and the gaps between successive edges are drawn from the geometric distribution
+        (see https://doi.org/10.1103/PhysRevE.71.036113).
+        Time and memory are O(n + m), where m is the number of sampled edges.
+
+        Parameters
+        ----------
+        num_nodes : int
+            Number of nodes.
+        prob_edge : float
+            Probability of edge existence.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            (src, tgt)
+            - src: Indices of source nodes of the edges.
+            - tgt: Indices of target nodes of the edges.
+
+        """
+        num_pairs = num_nodes * (num_nodes - 1) // 2
+        if prob_edge <= 0.0 or num_pairs == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        prob_edge = min(prob_edge, 1.0)
+
+        # Draw positions of edges by geometric skips
+        chunks = []
+        last_pos = -1
+        while True:
+            expected = (num_pairs - last_pos - 1) * prob_edge
+            size = int(expected + 4 * np.sqrt(expected)) + 16
+            pos = last_pos + np.cumsum(np.random.geometric(prob_edge, size))
+            if pos[-1] >= num_pairs:
+                chunks.append(pos[pos < num_pairs])
+                break
+            chunks.append(pos)
+            last_pos = pos[-1]
+        positions = np.concatenate(chunks)
+
+        # Convert positions to (src, tgt)
+        row_start = np.arange(num_nodes, dtype=np.int64)
+        row_start = row_start * (2 * num_nodes - row_start - 1) // 2
+        src = np.searchsorted(row_start, positions, side="right") - 1
+        tgt = positions - row_start[src] + src + 1
+        return src, tgt
@@ -1,6 +1,8 @@
 from .additional_setter import AdditionalSetter
 from .ccr_setter import CCRSetter
 from .deadline_setter import DeadlineSetter
+from .fused_random_setter import FusedRandomSetter
+from .property_plan import PropertyPlan
 from .property_setter_base import PropertySetterBase
 from .property_setter_factory import PropertySetterFactory
 from .random_setter import RandomSetter
@@ -9,8 +11,10 @@ from .utilization_setter import UtilizationSetter
 __all__ = [
     "PropertySetterBase",
     "PropertySetterFactory",
+    "PropertyPlan",
     "RandomSetter",
     "AdditionalSetter",
+    "FusedRandomSetter",
     "DeadlineSetter",
     "CCRSetter",
     "UtilizationSetter",
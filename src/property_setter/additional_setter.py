@@ -37,10 +37,10 @@ class AdditionalSetter(PropertySetterBase):
         """
         if node_properties := self._config.node_properties:
             for param_name, option in node_properties.items():
-                for node_i in dag.nodes:
-                    dag.nodes[node_i][param_name] = Util.random_choice(option)
+                values = Util.random_choices(option, dag.number_of_nodes())
+                nx.set_node_attributes(dag, dict(zip(dag.nodes, values)), param_name)
 
         if edge_properties := self._config.edge_properties:
             for param_name, option in edge_properties.items():
-                for src_i, tgt_i in dag.edges:
-                    dag.edges[src_i, tgt_i][param_name] = Util.random_choice(option)
+                values = Util.random_choices(option, dag.number_of_edges())
+                nx.set_edge_attributes(dag, dict(zip(dag.edges, values)), param_name)
@@ -57,38 +57,34 @@ class CCRSetter(PropertySetterBase):
 
     def _set_by_exec(self, dag: nx.DiGraph, ccr: float) -> None:
         # Set execution time
-        sum_exec = 0
-        for node_i in dag.nodes():
-            exec = Util.random_choice(self._config.execution_time)
-            dag.nodes[node_i]["execution_time"] = exec
-            sum_exec += exec
+        execs = Util.random_choices(self._config.execution_time, dag.number_of_nodes())
+        nx.set_node_attributes(dag, dict(zip(dag.nodes, execs)), "execution_time")
 
         # Calculate sum_comm
-        sum_comm = int(ccr * sum_exec)
+        sum_comm = int(ccr * sum(execs))
 
         # Set communication time
-        comm_grouping = self._grouping(sum_comm, dag.number_of_edges())
+        comm_grouping = self._grouping(
+            sum_comm, dag.number_of_edges(), legacy=bool(self._config.legacy_grouping)
+        )
         if not comm_grouping:
             self._output_round_up_warning("Communication time", "CCR")
             comm_grouping = [1 for _ in range(dag.number_of_edges())]
-        for edge, comm in zip(dag.edges(), comm_grouping):
-            dag.edges[edge[0], edge[1]]["communication_time"] = comm
+        nx.set_edge_attributes(dag, dict(zip(dag.edges, comm_grouping)), "communication_time")
 
     def _set_by_comm(self, dag: nx.DiGraph, ccr: float) -> None:
         # Set communication time
-        sum_comm = 0
-        for src_i, tgt_i in dag.edges():
-            comm = Util.random_choice(self._config.communication_time)
-            dag.edges[src_i, tgt_i]["communication_time"] = comm
-            sum_comm += comm
+        comms = Util.random_choices(self._config.communication_time, dag.number_of_edges())
+        nx.set_edge_attributes(dag, dict(zip(dag.edges, comms)), "communication_time")
 
         # Calculate sum_exec
-        sum_exec = int(sum_comm / ccr)
+        sum_exec = int(sum(comms) / ccr)
 
-        # Set communication time
-        exec_grouping = self._grouping(sum_exec, dag.number_of_nodes())
+        # Set execution time
+        exec_grouping = self._grouping(
+            sum_exec, dag.number_of_nodes(), legacy=bool(self._config.legacy_grouping)
+        )
         if not exec_grouping:
             self._output_round_up_warning("Execution time", "CCR")
             exec_grouping = [1 for _ in range(dag.number_of_nodes())]
-        for node_i, exec in zip(dag.nodes(), exec_grouping):
-            dag.nodes[node_i]["execution_time"] = exec
+        nx.set_node_attributes(dag, dict(zip(dag.nodes, exec_grouping)), "execution_time")
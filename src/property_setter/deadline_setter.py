@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 import networkx as nx
 
 from ..common import Util
@@ -31,12 +33,12 @@ class DeadlineSetter(PropertySetterBase):
             DAG.
 
         """
+        path_lens = self._get_longest_path_lens(dag, Util.get_source_nodes(dag))
         for exit_i in Util.get_sink_nodes(dag):
-            max_cp_len = 0
-            for entry_i in Util.get_source_nodes(dag):
-                cp_len = self._get_cp_len(dag, entry_i, exit_i)
-                if cp_len > max_cp_len:
-                    max_cp_len = cp_len
+            if dag.in_degree(exit_i) == 0:
+                max_cp_len = 0  # A path from a source node to itself is not counted.
+            else:
+                max_cp_len = max(path_lens[exit_i], 0)
 
             dag.nodes[exit_i]["end_to_end_deadline"] = int(
                 max_cp_len * Util.random_choice(self._config.ratio_of_deadline_to_critical_path)
@@ -59,6 +61,7 @@ class DeadlineSetter(PropertySetterBase):
         -------
         int
             Critical path length.
+            If there is no path from 'source' to 'exit', 0 is returned.
 
         Notes
         -----
@@ -66,17 +69,52 @@ class DeadlineSetter(PropertySetterBase):
         'Communication time' is also included in critical path length.
 
         """
-        cp_len = 0
-        for path in nx.all_simple_paths(dag, source=source, target=exit):
-            path_len = 0
-            for i in range(len(path)):
-                path_len += dag.nodes[path[i]]["execution_time"]
-                if i != len(path) - 1 and dag.edges[path[i], path[i + 1]].get(
-                    "communication_time"
-                ):
-                    path_len += dag.edges[path[i], path[i + 1]]["communication_time"]
-
-            if path_len > cp_len:
-                cp_len = path_len
-
-        return cp_len
+        if source == exit:
+            return 0
+        path_lens = DeadlineSetter._get_longest_path_lens(dag, [source])
+
+        return max(path_lens.get(exit, 0), 0)
+
+    @staticmethod
+    def _get_longest_path_lens(dag: nx.DiGraph, sources: List[int]) -> Dict[int, int]:
+        """Get longest path length from the sources to each node.
+
+        Dynamic programming in topological order. Time is O(V + E).
+
+        Parameters
+        ----------
+        dag : nx.DiGraph
+            DAG.
+        sources : List[int]
+            Indices of path sources.
+
+        Returns
+        -------
+        Dict[int, int]
+            Longest path length from any of 'sources' to each node reachable from them.
+
+        Notes
+        -----
+        The length of a path is the sum of 'Execution time' of its nodes
+        and 'Communication time' of its edges (if the edge has it).
+        The additions are performed in the order of the path,
+        so the lengths are the same as those summed path by path.
+
+        """
+        path_lens: Dict[int, int] = {}
+        for source_i in sources:
+            path_lens[source_i] = dag.nodes[source_i]["execution_time"]
+        for node_i in nx.topological_sort(dag):
+            max_len = None
+            for pred_i, _, comm in dag.in_edges(node_i, data="communication_time"):
+                if pred_i not in path_lens:
+                    continue
+                pred_len = path_lens[pred_i] + comm if comm else path_lens[pred_i]
+                if max_len is None or pred_len > max_len:
+                    max_len = pred_len
+            if max_len is not None:
+                path_len = max_len + dag.nodes[node_i]["execution_time"]
+                if node_i not in path_lens or path_len > path_lens[node_i]:
+                    path_lens[node_i] = path_len
+
+        return path_lens
@@ -0,0 +1,71 @@
+from typing import Any, List, Tuple
+
+import networkx as nx
+
+from ..common import Util
+from ..config import Config
+from .property_setter_base import PropertySetterBase
+
+
+class FusedRandomSetter(PropertySetterBase):
+    """Fused random setter class.
+
+    Set several attributes completely at random in a single pass over nodes and edges.
+
+    """
+
+    def __init__(self, config: Config, attributes: List[Tuple[str, str, Any]]) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        config : Config
+            Config.
+        attributes : List[Tuple[str, str, Any]]
+            (target, attribute_name, option) of each attribute to be set.
+            - target: "node" or "edge".
+            - attribute_name: Key of the attribute.
+            - option: Options for the value (see 'Util.random_choices').
+
+        Notes
+        -----
+        The values are drawn in the order of 'attributes',
+        so the random number sequence is the same as setting each attribute
+        with 'RandomSetter' or 'AdditionalSetter' in that order.
+
+        """
+        super().__init__(config)
+        self._attributes = attributes
+
+    def _validate_config(self, config: Config) -> None:
+        pass
+
+    @property
+    def attributes(self) -> List[Tuple[str, str, Any]]:
+        return self._attributes
+
+    def set(self, dag: nx.DiGraph) -> None:
+        """Completely random set all attributes.
+
+        Parameters
+        ----------
+        dag : nx.DiGraph
+            DAG
+
+        """
+        node_names, node_columns = [], []
+        edge_names, edge_columns = [], []
+        for target, attribute_name, option in self._attributes:
+            if target == "node":
+                node_names.append(attribute_name)
+                node_columns.append(Util.random_choices(option, dag.number_of_nodes()))
+            else:
+                edge_names.append(attribute_name)
+                edge_columns.append(Util.random_choices(option, dag.number_of_edges()))
+
+        if node_names:
+            for (_, data), values in zip(dag.nodes(data=True), zip(*node_columns)):
+                data.update(zip(node_names, values))
+        if edge_names:
+            for (_, _, data), values in zip(dag.edges(data=True), zip(*edge_columns)):
+                data.update(zip(edge_names, values))
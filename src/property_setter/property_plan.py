@@ -0,0 +1,44 @@
+from typing import List
+
+import networkx as nx
+
+from .property_setter_base import PropertySetterBase
+
+
+class PropertyPlan:
+    """Property plan class.
+
+    Ordered property setters of a combination,
+    compiled once by 'PropertySetterFactory.create_property_plan'.
+
+    """
+
+    def __init__(self, setters: List[PropertySetterBase]) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        setters : List[PropertySetterBase]
+            Property setters in the order of application.
+
+        """
+        self._setters = setters
+
+    def __len__(self) -> int:
+        return len(self._setters)
+
+    @property
+    def setters(self) -> List[PropertySetterBase]:
+        return self._setters
+
+    def set(self, dag: nx.DiGraph) -> None:
+        """Set all properties.
+
+        Parameters
+        ----------
+        dag : nx.DiGraph
+            DAG.
+
+        """
+        for setter in self._setters:
+            setter.set(dag)
@@ -4,8 +4,9 @@ from logging import getLogger
 from typing import List, Optional
 
 import networkx as nx
+import numpy as np
 
-from ..config import Config
+from ..config import CompiledConfig, Config
 
 logger = getLogger(__name__)
 
@@ -13,7 +14,7 @@ logger = getLogger(__name__)
 class PropertySetterBase(metaclass=ABCMeta):
     def __init__(self, config: Config) -> None:
         self._validate_config(config)
-        self._config = config
+        self._config = CompiledConfig.from_config(config)
 
     @abstractmethod
     def set(self, dag: nx.DiGraph) -> None:
@@ -24,28 +25,101 @@ class PropertySetterBase(metaclass=ABCMeta):
         raise NotImplementedError
 
     @staticmethod
-    def _grouping(sum: int, num_groups: int) -> Optional[List[int]]:
+    def _grouping(sum: int, num_groups: int, legacy: bool = False) -> Optional[List[int]]:
+        """Divide integer into groups randomly.
+
+        Parameters
+        ----------
+        sum : int
+            Integer to be divided.
+        num_groups : int
+            Number of groups.
+        legacy : bool, optional
+            Use the legacy splitting method, by default False
+
+        Returns
+        -------
+        Optional[List[int]]
+            Size of each group (>= 1), whose sum is equal to 'sum'.
+            If 'sum' < 'num_groups', None is returned.
+
+        Notes
+        -----
+        By default, 'num_groups' - 1 distinct cut points are sampled from [1, 'sum' - 1]
+        with NumPy, so every composition of 'sum' into 'num_groups' parts is equally likely.
+        The cost is O(k log k), where k is 'num_groups'.
+
+        If 'legacy' is True ('Legacy grouping' in the config), a random group of size 2 or more
+        is repeatedly split at a random point, as in earlier versions.
+        The resulting distribution (and random number sequence) is the same as
+        in earlier versions, but the cost is O(k^2).
+
+        """
         # Check feasibility
         if (sum / num_groups) < 1.0:
             return None  # Infeasible
 
-        groups = [[0 for _ in range(sum)]]
+        if legacy:
+            return PropertySetterBase._grouping_legacy(sum, num_groups)
+
+        cut_points = PropertySetterBase._sample_cut_points(sum, num_groups - 1)
+        return np.diff(cut_points, prepend=0, append=sum).tolist()
+
+    @staticmethod
+    def _sample_cut_points(sum: int, num_cuts: int) -> np.ndarray:
+        """Sample distinct cut points from [1, 'sum' - 1] uniformly.
+
+        Parameters
+        ----------
+        sum : int
+            Integer to be divided.
+        num_cuts : int
+            Number of cut points.
+
+        Returns
+        -------
+        np.ndarray
+            Sorted cut points.
+
+        Notes
+        -----
+        If the cut points are dense (i.e., 'sum' <= 32 * 'num_cuts'),
+        they are chosen from a permutation of [1, 'sum' - 1].
+        Otherwise, random integers are drawn in batches
+        and the first 'num_cuts' distinct values are kept,
+        so memory does not depend on 'sum'.
+
+        """
+        if sum <= 32 * num_cuts:
+            cut_points = np.random.choice(sum - 1, num_cuts, replace=False) + 1
+        else:
+            cut_points = np.empty(0, dtype=np.int64)
+            while cut_points.size < num_cuts:
+                draws = np.random.randint(1, sum, size=num_cuts - cut_points.size + 16)
+                cut_points = np.concatenate((cut_points, draws))
+                _, first_idx = np.unique(cut_points, return_index=True)
+                cut_points = cut_points[np.sort(first_idx)][:num_cuts]
+        cut_points.sort()
+
+        return cut_points
+
+    @staticmethod
+    def _grouping_legacy(sum: int, num_groups: int) -> List[int]:
+        groups = [sum]
         for _ in range(num_groups - 1):
             random.shuffle(groups)
             choose_group = groups.pop(0)
-            while len(choose_group) == 1:
+            while choose_group == 1:
                 groups.append(choose_group)
                 choose_group = groups.pop(0)
 
-            if len(choose_group) == 2:
-                groups.append([choose_group[0]])
-                groups.append([choose_group[-1]])
+            if choose_group == 2:
+                groups += [1, 1]
             else:
-                rand_idx = random.randint(1, len(choose_group) - 2)
-                groups.append(choose_group[:rand_idx])
-                groups.append(choose_group[rand_idx:])
+                rand_idx = random.randint(1, choose_group - 2)
+                groups += [rand_idx, choose_group - rand_idx]
 
-        return [len(group) for group in groups]
+        return groups
 
     @staticmethod
     def _output_round_up_warning(round_up_param: str, error_param: str) -> None:
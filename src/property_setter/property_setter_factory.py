@@ -1,7 +1,13 @@
+from typing import Any, List, Tuple
+
+from ..common import Util
 from ..config import Config
 from .additional_setter import AdditionalSetter
 from .ccr_setter import CCRSetter
 from .deadline_setter import DeadlineSetter
+from .fused_random_setter import FusedRandomSetter
+from .property_plan import PropertyPlan
+from .property_setter_base import PropertySetterBase
 from .random_setter import RandomSetter
 from .utilization_setter import UtilizationSetter
 
@@ -10,13 +16,85 @@ class PropertySetterFactory:
     """Property setter factory class."""
 
     @staticmethod
-    def create_utilization_setter(config: Config) -> UtilizationSetter:
+    def create_property_plan(config: Config) -> PropertyPlan:
+        """Create property plan.
+
+        The setters required by the config are resolved once per combination.
+
+        Parameters
+        ----------
+        config : Config
+            Config.
+
+        Returns
+        -------
+        PropertyPlan
+            Property plan.
+
+        Notes
+        -----
+        - 'CCR' overwrites all execution times.
+          Therefore, if 'CCR' is specified, execution times are not set beforehand
+          (i.e., only periods are set by utilization setter).
+        - Consecutive completely random attributes
+          ('Execution time', 'Communication time', 'Offset' and additional properties)
+          are set by a single 'FusedRandomSetter'.
+        - 'End-to-end deadline' is set after execution and communication times,
+          because it depends on them.
+
+        """
+        setters: List[PropertySetterBase] = []
+        random_attributes: List[Tuple[str, str, Any]] = []
+
+        def append_setter(setter: PropertySetterBase) -> None:
+            if random_attributes:
+                setters.append(FusedRandomSetter(config, random_attributes.copy()))
+                random_attributes.clear()
+            setters.append(setter)
+
+        # Setters for utilization, period, execution time and communication time.
+        if config.multi_rate:
+            append_setter(
+                PropertySetterFactory.create_utilization_setter(
+                    config, set_execution_time=not config.ccr
+                )
+            )
+        elif config.execution_time and not config.ccr:
+            random_attributes.append(("node", "execution_time", config.execution_time))
+        # HACK: RD-Gen assumes that 'Multi-rate' and 'CCR' are never specified at the same time.
+        #       If 'Multi-rate' and 'CCR' are specified at the same time,
+        #       the utilization rate is not protected.
+        if config.ccr:
+            append_setter(PropertySetterFactory.create_ccr_setter(config))
+        elif config.communication_time:
+            random_attributes.append(("edge", "communication_time", config.communication_time))
+        # Setter for end-to-end deadline.
+        if config.end_to_end_deadline:
+            append_setter(PropertySetterFactory.create_deadline_setter(config))
+        # Offset and additional properties.
+        if config.offset:
+            random_attributes.append(("node", Util.convert_to_property("Offset"), config.offset))
+        for param_name, option in (config.node_properties or {}).items():
+            random_attributes.append(("node", param_name, option))
+        for param_name, option in (config.edge_properties or {}).items():
+            random_attributes.append(("edge", param_name, option))
+        if random_attributes:
+            setters.append(FusedRandomSetter(config, random_attributes))
+
+        return PropertyPlan(setters)
+
+    @staticmethod
+    def create_utilization_setter(
+        config: Config, set_execution_time: bool = True
+    ) -> UtilizationSetter:
         """Create utilization setter.
 
         Parameters
         ----------
         config : Config
             Config.
+        set_execution_time : bool, optional
+            Set execution times as well as periods, by default True
 
         Returns
         -------
@@ -24,7 +102,7 @@ class PropertySetterFactory:
             Utilization setter.
 
         """
-        return UtilizationSetter(config)
+        return UtilizationSetter(config, set_execution_time)
 
     @staticmethod
     def create_ccr_setter(config: Config) -> CCRSetter:
@@ -29,6 +29,8 @@ class RandomSetter(PropertySetterBase):
         super().__init__(config)
         self._param_name = parameter_name
         self._target = target
+        self._property_name = Util.convert_to_property(self._param_name)
+        self._option = getattr(self._config, self._property_name)
 
     def _validate_config(self, config: Config) -> None:
         pass
@@ -42,11 +44,9 @@ class RandomSetter(PropertySetterBase):
             DAG
 
         """
-        property_name = Util.convert_to_property(self._param_name)
-        option = getattr(self._config, property_name)
         if self._target == "node":
-            for node_i in dag.nodes():
-                dag.nodes[node_i][property_name] = Util.random_choice(option)
+            values = Util.random_choices(self._option, dag.number_of_nodes())
+            nx.set_node_attributes(dag, dict(zip(dag.nodes, values)), self._property_name)
         else:
-            for src_i, tgt_i in dag.edges():
-                dag.edges[src_i, tgt_i][property_name] = Util.random_choice(option)
+            values = Util.random_choices(self._option, dag.number_of_edges())
+            nx.set_edge_attributes(dag, dict(zip(dag.edges, values)), self._property_name)
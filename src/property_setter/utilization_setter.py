@@ -1,13 +1,16 @@
+import math
 import random
 import sys
 from logging import getLogger
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import networkx as nx
+import numpy as np
 
-from ..common import Util
-from ..config import Config
+from ..common import OptionRange, Util
+from ..config import Config, PeriodicType, UtilizationMethod
 from ..dag_builder import ChainBasedDAG
+from ..exceptions import InfeasibleConfigError
 from .property_setter_base import PropertySetterBase
 
 logger = getLogger(__name__)
@@ -18,15 +21,55 @@ class UtilizationSetter(PropertySetterBase):
 
     Notes
     -----
+    'Total utilization' is distributed by 'Utilization method' in 'Multi-rate'
+    ("UUniFast" (default) or "RandFixedSum").
     If both 'Period' and 'Execution time' are specified,
     'Execution time' is determined based on utilization and period
     (i.e., the range of 'Execution time' specified is ignored).
     The minimum value of 'Execution time' is 1 and never 0.
+    If 'Maximum hyperperiod' is specified in 'Multi-rate',
+    a bound is chosen for each DAG and periods are chosen only from the divisors of the bound,
+    so the hyperperiod (i.e., LCM of all periods) never exceeds the bound.
+    The hyperperiod is recorded as dag.graph["hyperperiod"].
 
     """
 
-    def __init__(self, config: Config) -> None:
+    _UNIFORM_BLOCK_SIZE = 1 << 14
+
+    def __init__(self, config: Config, set_execution_time: bool = True) -> None:
+        """Constructor.
+
+        Parameters
+        ----------
+        config : Config
+            Config.
+        set_execution_time : bool, optional
+            Set execution times as well as periods, by default True.
+            If False, only periods are set
+            (e.g., when execution times are overwritten by 'CCR' later).
+
+        Raises
+        ------
+        InfeasibleConfigError
+            No period option divides a value of 'Maximum hyperperiod'.
+
+        """
         super().__init__(config)
+        self._set_execution_time = set_execution_time
+        self._uniforms = np.empty(0)
+        self._uniform_idx = 0
+        self._period_options = (
+            self._config.source_node_period,
+            self._config.sink_node_period,
+            self._config.period,
+        )
+        self._period_options_of_bound: Dict[int, Tuple[Any, Any, Any]] = {}
+        if self._config.maximum_hyperperiod:
+            bounds = self._config.maximum_hyperperiod
+            for bound in bounds if isinstance(bounds, (list, OptionRange)) else [bounds]:
+                self._period_options_of_bound[bound] = tuple(  # type: ignore
+                    self._get_divisor_option(option, bound) for option in self._period_options
+                )
 
     def _validate_config(self, config: Config) -> None:
         period = config.period
@@ -52,11 +95,17 @@ class UtilizationSetter(PropertySetterBase):
         the chain utilization is used (see https://par.nsf.gov/servlets/purl/10276465).
 
         """
+        if self._period_options_of_bound:
+            bound = Util.random_choice(self._config.maximum_hyperperiod)
+            self._period_options = self._period_options_of_bound[bound]
+
         total_utilization = self._config.total_utilization
-        is_chain_case = isinstance(dag, ChainBasedDAG) and Util.ambiguous_equals(
-            self._config.periodic_type, "chain"
+        is_chain_case = (
+            isinstance(dag, ChainBasedDAG) and self._config.periodic_type == PeriodicType.CHAIN
         )
-        if is_chain_case:
+        if not self._set_execution_time:
+            self._set_only_period(dag, is_chain_case)
+        elif is_chain_case:
             if total_utilization:
                 self._set_by_total_utilization_chain(dag)
             else:
@@ -67,12 +116,36 @@ class UtilizationSetter(PropertySetterBase):
             else:
                 self._set_by_only_max_utilization(dag)
 
-        # Set remain execution times
-        for node_i in dag.nodes:
-            if not dag.nodes[node_i].get("execution_time"):
-                dag.nodes[node_i]["execution_time"] = Util.random_choice(
-                    self._config.execution_time
-                )
+        if self._set_execution_time:
+            # Set remain execution times
+            for node_i in dag.nodes:
+                if not dag.nodes[node_i].get("execution_time"):
+                    dag.nodes[node_i]["execution_time"] = Util.random_choice(
+                        self._config.execution_time
+                    )
+
+        if self._period_options_of_bound:
+            periods = [period for _, period in dag.nodes(data="period") if period]
+            dag.graph["hyperperiod"] = int(np.lcm.reduce(periods)) if periods else 1
+
+    def _set_only_period(self, dag: nx.DiGraph, is_chain_case: bool) -> None:
+        """Set only period.
+
+        Parameters
+        ----------
+        dag : nx.DiGraph
+            DAG.
+        is_chain_case : bool
+            Whether the chain utilization is used.
+
+        """
+        source_nodes, sink_nodes = self._get_source_sink_sets(dag)
+        if is_chain_case:
+            timer_driven_nodes = [chain.head for chain in dag.chains]
+        else:
+            timer_driven_nodes = self._get_timer_driven_nodes(dag)
+        for timer_i in timer_driven_nodes:
+            dag.nodes[timer_i]["period"] = self._choice_period(timer_i, source_nodes, sink_nodes)
 
     def _set_by_total_utilization(self, dag: nx.DiGraph) -> None:
         """Set period and execution time based on total utilization.
@@ -84,14 +157,15 @@ class UtilizationSetter(PropertySetterBase):
 
         """
         timer_driven_nodes = self._get_timer_driven_nodes(dag)
-        utilizations = self._UUniFast(
+        utilizations = self._distribute_utilization(
             Util.random_choice(self._config.total_utilization),
             len(timer_driven_nodes),
             self._config.maximum_utilization,
         )
 
+        source_nodes, sink_nodes = self._get_source_sink_sets(dag)
         for timer_i, utilization in zip(timer_driven_nodes, utilizations):
-            selected_period = self._choice_period(dag, timer_i)
+            selected_period = self._choice_period(timer_i, source_nodes, sink_nodes)
             dag.nodes[timer_i]["period"] = selected_period
             exec = int(utilization * selected_period)
             if exec == 0:
@@ -101,18 +175,22 @@ class UtilizationSetter(PropertySetterBase):
 
     def _set_by_total_utilization_chain(self, chain_based_dag: ChainBasedDAG) -> None:
         timer_driven_nodes = self._get_timer_driven_nodes(chain_based_dag)
-        utilizations = self._UUniFast(
+        utilizations = self._distribute_utilization(
             Util.random_choice(self._config.total_utilization),
             len(timer_driven_nodes),
             self._config.maximum_utilization,
         )
 
+        utilization_of = dict(zip(timer_driven_nodes, utilizations))
+        source_nodes, sink_nodes = self._get_source_sink_sets(chain_based_dag)
         for chain in chain_based_dag.chains:
-            selected_period = self._choice_period(chain_based_dag, chain.head)
+            selected_period = self._choice_period(chain.head, source_nodes, sink_nodes)
             chain_based_dag.nodes[chain.head]["period"] = selected_period
-            utilization = utilizations[timer_driven_nodes.index(chain.head)]
+            utilization = utilization_of[chain.head]
             sum_exec = int(utilization * selected_period)
-            exec_grouping = self._grouping(sum_exec, chain.number_of_nodes())  # type: ignore
+            exec_grouping = self._grouping(  # type: ignore
+                sum_exec, chain.number_of_nodes(), legacy=bool(self._config.legacy_grouping)
+            )
             if not exec_grouping:
                 self._output_round_up_warning("Execution time", "Utilization")
                 exec_grouping = [1 for _ in range(chain.number_of_nodes())]
@@ -134,8 +212,9 @@ class UtilizationSetter(PropertySetterBase):
 
         """
         max_u = self._config.maximum_utilization or 1.0
+        source_nodes, sink_nodes = self._get_source_sink_sets(dag)
         for node_i in self._get_timer_driven_nodes(dag):
-            selected_period = self._choice_period(dag, node_i)
+            selected_period = self._choice_period(node_i, source_nodes, sink_nodes)
             dag.nodes[node_i]["period"] = selected_period
             min_u = 1 / selected_period  # Ensure 'Execution time' is at least 1.
             if min_u > max_u:
@@ -161,8 +240,9 @@ class UtilizationSetter(PropertySetterBase):
 
         """
         max_u = self._config.maximum_utilization or 1.0
+        source_nodes, sink_nodes = self._get_source_sink_sets(chain_based_dag)
         for chain in chain_based_dag.chains:
-            selected_period = self._choice_period(chain_based_dag, chain.head)
+            selected_period = self._choice_period(chain.head, source_nodes, sink_nodes)
             chain_based_dag.nodes[chain.head]["period"] = selected_period
             min_u = (
                 chain.number_of_nodes() / selected_period
@@ -173,13 +253,75 @@ class UtilizationSetter(PropertySetterBase):
             else:
                 utilization = random.uniform(min_u, max_u)
                 sum_exec = int(utilization * selected_period)
-                exec_grouping = self._grouping(sum_exec, chain.number_of_nodes())  # type: ignore
+                exec_grouping = self._grouping(  # type: ignore
+                sum_exec, chain.number_of_nodes(), legacy=bool(self._config.legacy_grouping)
+            )
                 if not exec_grouping:
                     self._output_round_up_warning("Execution time", "Utilization")
                     exec_grouping = [1 for _ in range(chain.number_of_nodes())]
             for node_i, exec in zip(chain.nodes, exec_grouping):
                 chain_based_dag.nodes[node_i]["execution_time"] = exec
 
+    def _distribute_utilization(
+        self, total_u: float, n: int, max_u: Optional[float] = None
+    ) -> List[float]:
+        """Distribute total utilization by 'Utilization method'.
+
+        Parameters
+        ----------
+        total_u : float
+            Total utilization.
+        n : int
+            Number of elements to distribute utilization.
+        max_u : float
+            Maximum utilization, by default None.
+
+        Returns
+        -------
+        List[float]
+            List of utilizations.
+
+        """
+        if self._config.utilization_method == UtilizationMethod.RAND_FIXED_SUM:
+            return self._RandFixedSum(total_u, n, max_u)
+        if not max_u:
+            return self._UUniFast_vectorized(total_u, self._draw_uniforms(n - 1)).tolist()
+        return self._UUniFast(total_u, n, max_u)
+
+    def _draw_uniforms(self, size: int) -> np.ndarray:
+        """Draw uniform random numbers in [0, 1) from the buffer.
+
+        The buffer is refilled with '_UNIFORM_BLOCK_SIZE' (or 'size' if larger) numbers
+        drawn by a single call of 'np.random.random_sample',
+        so the numbers for many DAGs are drawn at once.
+        The numbers are consumed in order, so the results are reproducible from 'Seed'.
+
+        Parameters
+        ----------
+        size : int
+            Number of random numbers.
+
+        Returns
+        -------
+        np.ndarray
+            Uniform random numbers.
+            If 'size' <= 0, an empty array is returned and the buffer is not consumed.
+
+        """
+        if size <= 0:
+            return np.empty(0)
+
+        if self._uniform_idx + size > self._uniforms.size:
+            remain = self._uniforms[self._uniform_idx :]
+            self._uniforms = np.concatenate(
+                (remain, np.random.random_sample(max(size, self._UNIFORM_BLOCK_SIZE)))
+            )
+            self._uniform_idx = 0
+        uniforms = self._uniforms[self._uniform_idx : self._uniform_idx + size]
+        self._uniform_idx += size
+
+        return uniforms
+
     @staticmethod
     def _UUniFast(total_u: float, n: int, max_u: Optional[float] = None) -> List[float]:
         """Determine utilization based on UUniFast method.
@@ -212,13 +354,7 @@ class UtilizationSetter(PropertySetterBase):
         """
         if max_u:
             if (total_u / n) >= max_u:
-                logger.warning(
-                    "Only either 'Total utilization' or 'Maximum utilization' can be satisfied."
-                    "Therefore, 'Total utilization' is ignored "
-                    "and each utilization is set to 'Maximum utilization'."
-                    "To prevent this, it is recommended to reduce 'Total utilization', "
-                    "increase 'Maximum utilization', or increase the number of nodes."
-                )
+                UtilizationSetter._output_max_utilization_warning()
                 utilizations = [max_u for _ in range(n)]
             else:
                 utilizations = UtilizationSetter._UUniFast_with_max_u(total_u, n, max_u)
@@ -235,6 +371,37 @@ class UtilizationSetter(PropertySetterBase):
 
         return utilizations
 
+    @staticmethod
+    def _UUniFast_vectorized(total_u: float, uniforms: np.ndarray) -> np.ndarray:
+        """Determine utilization based on UUniFast method using given random numbers.
+
+        Parameters
+        ----------
+        total_u : float
+            Total utilization.
+        uniforms : np.ndarray
+            Uniform random numbers in [0, 1) whose last axis has length n - 1.
+            A 2-D array of shape (m, n - 1) gives m utilization vectors at once.
+
+        Returns
+        -------
+        np.ndarray
+            Utilizations whose last axis has length n.
+
+        Notes
+        -----
+        The i-th remaining utilization of the original method is
+        'total_u' * prod_{j <= i} uniforms[j] ** (1 / (n - j)),
+        so all of them are computed with a single cumulative product.
+
+        """
+        n = uniforms.shape[-1] + 1
+        remain_u = total_u * np.cumprod(uniforms ** (1 / np.arange(n, 1, -1)), axis=-1)
+        total = np.full(uniforms.shape[:-1] + (1,), float(total_u))
+        remain_u = np.concatenate((total, remain_u), axis=-1)
+
+        return np.concatenate((-np.diff(remain_u, axis=-1), remain_u[..., -1:]), axis=-1)
+
     @staticmethod
     def _UUniFast_with_max_u(total_u: float, n: int, max_u: float) -> List[float]:
         """Determine utilization based on UUniFast method not to exceed 'max_u'.
@@ -282,12 +449,211 @@ class UtilizationSetter(PropertySetterBase):
 
         return utilizations
 
-    def _choice_period(self, dag: nx.DiGraph, node_i: int) -> int:
-        if self._config.source_node_period and node_i in Util.get_source_nodes(dag):
-            return Util.random_choice(self._config.source_node_period)
-        if self._config.sink_node_period and node_i in Util.get_sink_nodes(dag):
-            return Util.random_choice(self._config.sink_node_period)
-        return Util.random_choice(self._config.period)
+    def _get_source_sink_sets(self, dag: nx.DiGraph) -> Tuple[Set[int], Set[int]]:
+        """Get sets of source nodes and sink nodes for '_choice_period'.
+
+        Parameters
+        ----------
+        dag : nx.DiGraph
+            DAG.
+
+        Returns
+        -------
+        Tuple[Set[int], Set[int]]
+            (source_nodes, sink_nodes)
+            - source_nodes: Set of source nodes. Empty if 'Source node period' is not specified.
+            - sink_nodes: Set of sink nodes. Empty if 'Sink node period' is not specified.
+
+        """
+        source_nodes = (
+            set(Util.get_source_nodes(dag)) if self._config.source_node_period else set()
+        )
+        sink_nodes = set(Util.get_sink_nodes(dag)) if self._config.sink_node_period else set()
+
+        return source_nodes, sink_nodes
+
+    @staticmethod
+    def _RandFixedSum(total_u: float, n: int, max_u: Optional[float] = None) -> List[float]:
+        """Determine utilization based on RandFixedSum method.
+
+        The utilizations are drawn uniformly from the set of vectors
+        whose elements are in [0, 'max_u'] and sum to 'total_u'.
+        For detail, see P. Emberson, R. Stafford, and R. I. Davis,
+        "Techniques for the synthesis of multiprocessor tasksets", WATERS 2010.
+
+        Parameters
+        ----------
+        total_u : float
+            Total utilization.
+        n : int
+            Number of elements to distribute utilization.
+        max_u : float
+            Maximum utilization, by default None.
+
+        Returns
+        -------
+        List[float]
+            List of utilizations.
+
+        Notes
+        -----
+        - If both 'Total utilization' and 'Maximum utilization' cannot be met,
+          ignore 'Total utilization' and set each utilization to 'Maximum utilization'.
+        - If 'max_u' is None, the utilizations are drawn uniformly from the simplex,
+          which is the same distribution as the UUniFast method.
+        - Unlike '_UUniFast_with_max_u', no rejection is performed.
+          Time and memory are O(n * min(k, n - k)), where k = 'total_u' / 'max_u'.
+
+        """
+        if max_u:
+            if (total_u / n) >= max_u:
+                UtilizationSetter._output_max_utilization_warning()
+                return [max_u for _ in range(n)]
+        else:
+            max_u = total_u
+
+        # Sample n values in [0, 1] whose sum is s, and scale them by 'max_u'.
+        s = total_u / max_u
+        flip = s > n / 2
+        if flip:  # Use symmetry x -> 1 - x to bound k by n / 2.
+            s = n - s
+        k = max(min(int(s), n - 1), 0)
+        s = max(min(s, k + 1), k)
+        num_cols = k + 1
+
+        # Compute the probabilities of choosing simplex type (columns > k + 1 are not used).
+        s1 = s - np.arange(k, k - n, -1, dtype=float)
+        s2 = np.arange(k + n, k, -1, dtype=float) - s
+        w = np.zeros((n, num_cols + 1))
+        w[0, 1] = 1.0
+        t = np.zeros((max(n - 1, 0), num_cols))
+        for i in range(2, n + 1):
+            c = min(i, num_cols)
+            tmp1 = w[i - 2, 1 : c + 1] * s1[:c] / i
+            tmp2 = w[i - 2, :c] * s2[n - i : n - i + c] / i
+            w[i - 1, 1 : c + 1] = tmp1 + tmp2
+            tmp3 = w[i - 1, 1 : c + 1] + np.finfo(float).tiny
+            tmp4 = s2[n - i : n - i + c] > s1[:c]
+            t[i - 2, :c] = np.where(tmp4, tmp2 / tmp3, 1 - tmp1 / tmp3)
+            w[i - 1] /= w[i - 1].max()  # Normalize to prevent underflow.
+
+        # Sample a point in the chosen simplices.
+        rt = np.random.random_sample(max(n - 1, 0))
+        rs = np.random.random_sample(max(n - 1, 0))
+        x = np.zeros(n)
+        j = k
+        sm = 0.0
+        pr = 1.0
+        for i in range(n - 1, 0, -1):
+            e = int(rt[n - i - 1] <= t[i - 1, j])
+            sx = rs[n - i - 1] ** (1 / i)
+            sm += (1 - sx) * pr * s / (i + 1)
+            pr *= sx
+            x[n - i - 1] = sm + pr * e
+            s -= e
+            j -= e
+        x[n - 1] = sm + pr * s
+
+        if flip:
+            x = 1 - x
+        x = np.random.permutation(x) * max_u
+
+        return x.tolist()
+
+    @staticmethod
+    def _output_max_utilization_warning() -> None:
+        logger.warning(
+            "Only either 'Total utilization' or 'Maximum utilization' can be satisfied."
+            "Therefore, 'Total utilization' is ignored "
+            "and each utilization is set to 'Maximum utilization'."
+            "To prevent this, it is recommended to reduce 'Total utilization', "
+            "increase 'Maximum utilization', or increase the number of nodes."
+        )
+
+    def _choice_period(self, node_i: int, source_nodes: Set[int], sink_nodes: Set[int]) -> int:
+        source_node_period, sink_node_period, period = self._period_options
+        if source_node_period and node_i in source_nodes:
+            return Util.random_choice(source_node_period)
+        if sink_node_period and node_i in sink_nodes:
+            return Util.random_choice(sink_node_period)
+        return Util.random_choice(period)
+
+    @staticmethod
+    def _get_divisor_option(option: Any, bound: int) -> Any:
+        """Restrict period option to divisors of maximum hyperperiod.
+
+        Parameters
+        ----------
+        option : Any
+            Period option (int, list of int or OptionRange). If None, None is returned.
+        bound : int
+            Maximum hyperperiod.
+
+        Returns
+        -------
+        Any
+            Period option consisting only of divisors of 'bound'.
+
+        Raises
+        ------
+        InfeasibleConfigError
+            No period in 'option' divides 'bound'.
+
+        Notes
+        -----
+        An OptionRange is not expanded (see '_get_divisors_in_range').
+
+        """
+        if option is None:
+            return None
+        is_list = isinstance(option, (list, OptionRange))
+        if isinstance(option, OptionRange):
+            divisors = UtilizationSetter._get_divisors_in_range(option, bound)
+        else:
+            periods = option if is_list else [option]
+            divisors = [period for period in periods if bound % period == 0]
+        if not divisors:
+            raise InfeasibleConfigError(
+                f"No period in {option} divides 'Maximum hyperperiod' ({bound})."
+            )
+
+        return divisors if is_list else divisors[0]
+
+    @staticmethod
+    def _get_divisors_in_range(option: OptionRange, bound: int) -> List[int]:
+        """Get periods in option range that divide maximum hyperperiod.
+
+        Parameters
+        ----------
+        option : OptionRange
+            Period option.
+        bound : int
+            Maximum hyperperiod.
+
+        Returns
+        -------
+        List[int]
+            Periods in 'option' dividing 'bound', in the order of 'option'.
+
+        Notes
+        -----
+        If 'option' has at most sqrt('bound') values, it is scanned lazily.
+        Otherwise, the divisors of 'bound' are enumerated in O(sqrt('bound'))
+        and each one is looked up in 'option' in O(1),
+        so the cost does not depend on the length of 'option'.
+
+        """
+        root = math.isqrt(bound) if bound > 0 else 0
+        if len(option) <= root or not isinstance(option[0], int):
+            return [period for period in option if bound % period == 0]
+
+        candidates = set()
+        for d in range(1, root + 1):
+            if bound % d == 0:
+                candidates.update((d, bound // d, -d, -(bound // d)))
+        divisors = [period for period in candidates if period in option]
+
+        return sorted(divisors, reverse=option[0] > option[-1])
 
     def _get_timer_driven_nodes(self, dag: nx.DiGraph) -> List[int]:
         """Get indices of timer-driven nodes according to 'Periodic type'.
@@ -305,13 +671,13 @@ class UtilizationSetter(PropertySetterBase):
         """
         periodic_type = self._config.periodic_type
         timer_driven_nodes: List[int]
-        if Util.ambiguous_equals(periodic_type, "All"):
+        if periodic_type == PeriodicType.ALL:
             timer_driven_nodes = list(dag.nodes())
-        elif Util.ambiguous_equals(periodic_type, "IO"):
+        elif periodic_type == PeriodicType.IO:
             timer_driven_nodes = list(set(Util.get_source_nodes(dag) + Util.get_sink_nodes(dag)))
-        elif Util.ambiguous_equals(periodic_type, "Entry"):
+        elif periodic_type == PeriodicType.ENTRY:
             timer_driven_nodes = Util.get_source_nodes(dag)
-        elif isinstance(dag, ChainBasedDAG) and Util.ambiguous_equals(periodic_type, "Chain"):
+        elif isinstance(dag, ChainBasedDAG) and periodic_type == PeriodicType.CHAIN:
             timer_driven_nodes = dag.chain_heads
 
         return timer_driven_nodes
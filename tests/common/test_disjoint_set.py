@@ -0,0 +1,38 @@
+import random
+
+import networkx as nx
+import pytest
+
+from src.common import DisjointSet
+
+
+class TestDisjointSet:
+    def test_union_find(self):
+        disjoint_set = DisjointSet(range(5))
+        assert disjoint_set.number_of_sets == 5
+
+        assert disjoint_set.union(0, 1)
+        assert disjoint_set.union(3, 4)
+        assert not disjoint_set.union(1, 0)
+        assert disjoint_set.number_of_sets == 3
+        assert disjoint_set.find(0) == disjoint_set.find(1)
+        assert disjoint_set.find(0) != disjoint_set.find(3)
+
+        disjoint_set.add(5)
+        assert 5 in disjoint_set
+        assert len(disjoint_set) == 6
+        assert sorted(sorted(s) for s in disjoint_set.get_sets()) == [[0, 1], [2], [3, 4], [5]]
+
+    @pytest.mark.parametrize("number_of_nodes", list(range(1, 40, 3)))
+    def test_from_graph(self, number_of_nodes):
+        G = nx.DiGraph()
+        G.add_nodes_from(range(number_of_nodes))
+        for _ in range(number_of_nodes // 2):
+            src_i, tgt_i = sorted(random.sample(range(number_of_nodes + 1), 2))
+            if tgt_i < number_of_nodes:
+                G.add_edge(src_i, tgt_i)
+
+        disjoint_set = DisjointSet.from_graph(G)
+        comps = sorted(sorted(comp) for comp in nx.weakly_connected_components(G))
+        assert disjoint_set.number_of_sets == len(comps)
+        assert sorted(sorted(s) for s in disjoint_set.get_sets()) == comps
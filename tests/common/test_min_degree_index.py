@@ -0,0 +1,84 @@
+import random
+
+import networkx as nx
+import pytest
+
+from src.common import MinDegreeIndex, Util
+
+
+class TestMinDegreeIndex:
+    def test_get_min_first_minimum(self):
+        index = MinDegreeIndex([(3, 1), (1, 0), (2, 0), (0, 2)])
+        assert index.get_min() == 1
+        assert index.get_min_degree() == 0
+
+        index.increment(1)
+        assert index.get_min() == 2
+
+        index.increment(2)
+        assert index.get_min() == 3
+        assert index.get_min_degree() == 1
+
+    def test_get_min_moved_node_precedes(self):
+        index = MinDegreeIndex([(0, 0), (1, 1)])
+        index.increment(0)
+        assert index.get_min() == 0
+
+    def test_decrease_key(self):
+        index = MinDegreeIndex([(0, 3), (1, 2)])
+        assert index.get_min() == 1
+
+        index.update(0, 1)
+        assert index.get_min() == 0
+        index.update(1, 1)
+        assert index.get_min() == 0
+        index.update(0, 5)
+        assert index.get_min() == 1
+        assert index.get_min_degree() == 1
+
+    def test_add_remove(self):
+        index = MinDegreeIndex([(0, 1), (1, 1)])
+        index.remove(0)
+        assert 0 not in index
+        assert len(index) == 1
+        assert index.get_min() == 1
+
+        index.add(0, 1)
+        assert index.get_min() == 1
+        index.add(2, 0)
+        assert index.get_min() == 2
+
+        with pytest.raises(KeyError):
+            index.add(2, 0)
+
+    def test_empty(self):
+        index = MinDegreeIndex([(0, 0)])
+        index.remove(0)
+        with pytest.raises(ValueError):
+            index.get_min()
+
+    @pytest.mark.parametrize("number_of_nodes", list(range(1, 30)))
+    def test_same_as_get_min_out_node(self, number_of_nodes):
+        G = nx.DiGraph()
+        G.add_nodes_from(range(number_of_nodes))
+        option = random.sample(list(G.nodes), number_of_nodes)
+        index = MinDegreeIndex((node_i, G.out_degree(node_i)) for node_i in option)
+        for _ in range(number_of_nodes * 3):
+            assert index.get_min() == Util.get_min_out_node(G, option)
+            src_i = index.get_min()
+            tgt_i = number_of_nodes + G.number_of_edges()
+            G.add_edge(src_i, tgt_i)
+            index.increment(src_i)
+
+    @pytest.mark.parametrize("number_of_nodes", list(range(1, 30)))
+    def test_same_as_get_min_out_node_random_update(self, number_of_nodes):
+        G = nx.DiGraph()
+        G.add_nodes_from(range(number_of_nodes))
+        option = list(G.nodes)
+        index = MinDegreeIndex((node_i, G.out_degree(node_i)) for node_i in option)
+        for _ in range(number_of_nodes * 3):
+            src_i = random.choice(option)
+            tgt_i = number_of_nodes + G.number_of_edges()
+            G.add_edge(src_i, tgt_i)
+            index.increment(src_i)
+            assert index.get_min() == Util.get_min_out_node(G, option)
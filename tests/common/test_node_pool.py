@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from src.common import NodePool
+
+
+class TestNodePool:
+    def test_add_remove(self):
+        pool = NodePool([0, 1, 2])
+        pool.add(3)
+        pool.add(3)
+        assert len(pool) == 4
+
+        pool.remove(1)
+        assert len(pool) == 3
+        assert 1 not in pool
+        for node_i in [0, 2, 3]:
+            assert node_i in pool
+
+        pool.remove(3)
+        assert sorted(pool.sample(10)) == [0, 2]
+
+    def test_remove_not_exist(self):
+        pool = NodePool([0])
+        with pytest.raises(KeyError):
+            pool.remove(1)
+
+    @pytest.mark.parametrize("k", list(range(0, 12)))
+    def test_sample(self, k):
+        nodes = list(range(10))
+        pool = NodePool(nodes)
+        for node_i in random.sample(nodes, 3):
+            pool.remove(node_i)
+
+        sampled = pool.sample(k)
+        assert len(sampled) == min(k, 7)
+        assert len(set(sampled)) == len(sampled)
+        for node_i in sampled:
+            assert node_i in pool
@@ -0,0 +1,101 @@
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from src.common import OptionRange, Util
+
+
+def expand(start: float, stop: float, step: float, m: int) -> list:
+    if start.is_integer() and stop.is_integer() and step.is_integer():
+        expanded = list(range(int(start), int(stop), int(step)))
+        if (stop - start) % step == 0:
+            expanded.append(int(stop))
+    else:
+        expanded = [round(n, m) for n in np.arange(start, stop, step)]
+        if ((stop * (10**m)) - start * (10**m)) % (step * (10**m)) < 10**-10:
+            expanded.append(stop)
+    return expanded
+
+
+class TestOptionRange:
+    @pytest.mark.parametrize(
+        "start, stop, step, m",
+        [
+            (1.0, 1.0, 1.0, 0),
+            (1.0, 7.0, 2.0, 0),
+            (1.0, 6.0, 2.0, 0),
+            (0.1, 0.7, 0.2, 1),
+            (0.1, 0.6, 0.2, 1),
+            (5.0, 6.5, 0.1, 1),
+            (0.01, 1.0, 0.03, 2),
+            (0.00000000001, 0.00000000007, 0.00000000002, 11),
+        ],
+    )
+    def test_equal_to_expanded(self, start, stop, step, m):
+        option_range = OptionRange(start, stop, step)
+        expanded = expand(start, stop, step, m)
+
+        assert option_range == expanded
+        assert list(option_range) == expanded
+        assert option_range.take(np.arange(len(expanded))) == expanded
+        assert option_range[-1] == expanded[-1]
+        assert option_range[1:3] == expanded[1:3]
+        assert option_range.min() == min(expanded)
+        assert option_range.max() == max(expanded)
+        for value in option_range:
+            assert type(value) is (int if isinstance(expanded[0], int) else float)
+
+    def test_index_error(self):
+        option_range = OptionRange(1.0, 3.0, 1.0)
+        with pytest.raises(IndexError):
+            option_range[3]
+        with pytest.raises(IndexError):
+            option_range[-4]
+
+    @pytest.mark.parametrize(
+        "start, stop, step",
+        [
+            (1.0, 7.0, 2.0),
+            (1.0, 6.0, 2.0),
+            (10.0, 1.0, -3.0),
+            (0.1, 0.7, 0.2),
+        ],
+    )
+    def test_contains(self, start, stop, step):
+        option_range = OptionRange(start, stop, step)
+        expanded = list(option_range)
+        for value in list(range(-3, 12)) + [0.3, 3.0, 3.5, "1", np.int64(7)]:
+            assert (value in option_range) == (value in expanded)
+
+    def test_large_range(self):
+        option_range = OptionRange(1.0, 1000000.0, 1.0)
+        assert len(option_range) == 1000000
+        assert option_range[999999] == 1000000
+        assert 500000 in option_range
+        assert len(pickle.dumps(option_range)) < 200
+
+    def test_random_choice(self):
+        option_range = OptionRange(1.0, 100.0, 3.0)
+        random.seed(0)
+        chosen = [Util.random_choice(option_range) for _ in range(50)]
+        random.seed(0)
+        expected = [Util.random_choice(list(option_range)) for _ in range(50)]
+        assert chosen == expected
+
+    def test_random_choices(self):
+        option_range = OptionRange(0.5, 10.0, 0.5)
+        np.random.seed(0)
+        chosen = Util.random_choices(option_range, 100)
+        np.random.seed(0)
+        expected = Util.random_choices(list(option_range), 100)
+        assert chosen == expected
+        for value in chosen:
+            assert type(value) is float
+
+    def test_pickle(self):
+        option_range = OptionRange(0.1, 0.7, 0.2)
+        loaded = pickle.loads(pickle.dumps(option_range))
+        assert loaded == option_range
+        assert list(loaded) == list(option_range)
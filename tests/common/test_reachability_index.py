@@ -0,0 +1,54 @@
+import random
+
+import networkx as nx
+import pytest
+
+from src.common import ReachabilityIndex
+
+
+def get_random_dag(number_of_nodes: int) -> nx.DiGraph:
+    G = nx.DiGraph()
+    G.add_nodes_from(random.sample(range(number_of_nodes), number_of_nodes))
+    for i in range(number_of_nodes):
+        for j in range(i + 1, number_of_nodes):
+            if random.random() < 0.1:
+                G.add_edge(i, j)
+    return G
+
+
+class TestReachabilityIndex:
+    @pytest.mark.parametrize("number_of_nodes", list(range(1, 30)))
+    def test_init(self, number_of_nodes):
+        G = get_random_dag(number_of_nodes)
+        reachability = ReachabilityIndex(G)
+        for node_i in G.nodes:
+            assert set(reachability.to_nodes(reachability.ancestors(node_i))) == nx.ancestors(
+                G, node_i
+            )
+            assert set(
+                reachability.to_nodes(reachability.descendants(node_i))
+            ) == nx.descendants(G, node_i)
+
+    @pytest.mark.parametrize("number_of_nodes", list(range(2, 30)))
+    def test_add_edge(self, number_of_nodes):
+        G = get_random_dag(number_of_nodes)
+        reachability = ReachabilityIndex(G)
+        for _ in range(number_of_nodes):
+            src_i, tgt_i = sorted(random.sample(range(number_of_nodes), 2))
+            G.add_edge(src_i, tgt_i)
+            reachability.add_edge(src_i, tgt_i)
+
+        for node_i in G.nodes:
+            assert set(reachability.to_nodes(reachability.ancestors(node_i))) == nx.ancestors(
+                G, node_i
+            )
+            assert set(
+                reachability.to_nodes(reachability.descendants(node_i))
+            ) == nx.descendants(G, node_i)
+
+    def test_to_bitset(self):
+        G = nx.DiGraph()
+        G.add_nodes_from([5, 3, 9])
+        reachability = ReachabilityIndex(G)
+        assert sorted(reachability.to_nodes(reachability.to_bitset([9, 5]))) == [5, 9]
+        assert reachability.to_nodes(0) == []
@@ -16,6 +16,17 @@ class TestUtil:
     def test_random_choice_not_list(self):
         assert Util.random_choice(1) == 1
 
+    def test_random_choices_list(self):
+        values = Util.random_choices([1, 2.5, "a"], 100)
+        assert len(values) == 100
+        for v in values:
+            assert v in [1, 2.5, "a"]
+            assert type(v) in (int, float, str)
+
+    def test_random_choices_not_list(self):
+        assert Util.random_choices(1, 3) == [1, 1, 1]
+        assert Util.random_choices(1, 0) == []
+
     def test_get_min_in_node_exist_0(self):
         G = nx.DiGraph()
         G.add_node(0)
@@ -24,24 +24,24 @@ def get_config_raw_base() -> dict:
 
 
 class TestComboGenerator:
-    def test_convert_tuple_to_list_exist_space(self):
-        assert ComboGenerator._convert_tuple_to_list("(1, 2,1)") == [1, 2]
-
-    def test_convert_tuple_to_list_exist_arg_names(self):
-        assert ComboGenerator._convert_tuple_to_list("(start=1,stop=2, step=1)") == [1, 2]
-
-    def test_convert_tuple_to_list_int(self):
-        assert ComboGenerator._convert_tuple_to_list("(1, 1, 1)") == [1]
-        assert ComboGenerator._convert_tuple_to_list("(1, 2, 1)") == [1, 2]
-        assert ComboGenerator._convert_tuple_to_list("(1, 6, 2)") == [1, 3, 5]
-        assert ComboGenerator._convert_tuple_to_list("(1, 7, 2)") == [1, 3, 5, 7]
-
-    def test_convert_tuple_to_list_float(self):
-        assert ComboGenerator._convert_tuple_to_list("(0.1, 0.1, 0.1)") == [0.1]
-        assert ComboGenerator._convert_tuple_to_list("(0.1, 0.2, 0.1)") == [0.1, 0.2]
-        assert ComboGenerator._convert_tuple_to_list("(0.1, 0.6, 0.2)") == [0.1, 0.3, 0.5]
-        assert ComboGenerator._convert_tuple_to_list("(0.1, 0.7, 0.2)") == [0.1, 0.3, 0.5, 0.7]
-        assert ComboGenerator._convert_tuple_to_list(
+    def test_convert_tuple_to_range_exist_space(self):
+        assert ComboGenerator._convert_tuple_to_range("(1, 2,1)") == [1, 2]
+
+    def test_convert_tuple_to_range_exist_arg_names(self):
+        assert ComboGenerator._convert_tuple_to_range("(start=1,stop=2, step=1)") == [1, 2]
+
+    def test_convert_tuple_to_range_int(self):
+        assert ComboGenerator._convert_tuple_to_range("(1, 1, 1)") == [1]
+        assert ComboGenerator._convert_tuple_to_range("(1, 2, 1)") == [1, 2]
+        assert ComboGenerator._convert_tuple_to_range("(1, 6, 2)") == [1, 3, 5]
+        assert ComboGenerator._convert_tuple_to_range("(1, 7, 2)") == [1, 3, 5, 7]
+
+    def test_convert_tuple_to_range_float(self):
+        assert ComboGenerator._convert_tuple_to_range("(0.1, 0.1, 0.1)") == [0.1]
+        assert ComboGenerator._convert_tuple_to_range("(0.1, 0.2, 0.1)") == [0.1, 0.2]
+        assert ComboGenerator._convert_tuple_to_range("(0.1, 0.6, 0.2)") == [0.1, 0.3, 0.5]
+        assert ComboGenerator._convert_tuple_to_range("(0.1, 0.7, 0.2)") == [0.1, 0.3, 0.5, 0.7]
+        assert ComboGenerator._convert_tuple_to_range(
             "(0.00000000001, 0.00000000007, 0.00000000002)"
         ) == [0.00000000001, 0.00000000003, 0.00000000005, 0.00000000007]
 
@@ -109,6 +109,16 @@ class TestComboGenerator:
                 {"Number of nodes": 2, "Ratio of deadline to critical path": 4},
             ]
 
+    def test_get_combo_log_iter(self, mocker):
+        config_raw = get_config_raw_base()
+        combo_gen = ComboGenerator(config_raw)
+        overlay_mock = mocker.patch.object(Config, "overlay")
+        combos = list(combo_gen.get_combo_log_iter())
+        overlay_mock.assert_not_called()
+
+        mocker.stopall()
+        assert combos == [(dir_name, log) for dir_name, log, _ in combo_gen.get_combo_iter()]
+
     def test_get_combo_iter_config_normal(self):
         config_raw = get_config_raw_base()
         combo_iter = ComboGenerator(config_raw).get_combo_iter()
@@ -122,6 +132,14 @@ class TestComboGenerator:
 
         assert len(configs) == 4
 
+    def test_get_combo_iter_config_shared(self):
+        config_raw = get_config_raw_base()
+        combo_gen = ComboGenerator(config_raw)
+        configs = [config for _, _, config in combo_gen.get_combo_iter()]
+        for config in configs:
+            assert config.execution_time is configs[0].execution_time
+        assert config_raw["Graph structure"]["Number of nodes"] == {"Combination": [1, 2]}
+
     def test_get_combo_iter_config_additional(self):
         config_raw = get_config_raw_base()
         config_raw["Properties"]["Additional properties"] = {
@@ -0,0 +1,74 @@
+import pickle
+
+import pytest
+
+from src.config import CompiledConfig, Config, GenerationMethod, PeriodicType, UtilizationMethod
+
+
+def get_config_raw() -> dict:
+    config_raw = {
+        "Seed": 0,
+        "Number of DAGs": 10,
+        "Graph structure": {
+            "Generation method": "chain-based",
+            "Number of chains": {"Random": [1, 2]},
+            "Main sequence length": {"Fixed": 3},
+            "Vertically link chains": {"Number of source nodes": {"Fixed": 1}},
+        },
+        "Properties": {
+            "Execution time": {"Random": [1, 2, 3]},
+            "Multi-rate": {
+                "Periodic type": "chain",
+                "Period": {"Random": [10, 20]},
+                "Utilization method": "randfixedsum",
+            },
+        },
+        "Output formats": {"DAG": {"YAML": True}},
+    }
+    return config_raw
+
+
+class TestCompiledConfig:
+    @pytest.mark.parametrize("optimize", [True, False])
+    def test_compile(self, optimize):
+        config = Config(get_config_raw())
+        if optimize:
+            config.optimize()
+        compiled = CompiledConfig(config)
+
+        assert compiled.seed == 0
+        assert compiled.number_of_dags == 10
+        assert compiled.generation_method is GenerationMethod.CHAIN_BASED
+        assert compiled.periodic_type is PeriodicType.CHAIN
+        assert compiled.utilization_method is UtilizationMethod.RAND_FIXED_SUM
+        assert compiled.number_of_chains == [1, 2]
+        assert compiled.main_sequence_length == 3
+        assert compiled.number_of_source_nodes == 1
+        assert compiled.execution_time == [1, 2, 3]
+        assert compiled.period == [10, 20]
+        assert compiled.ccr is None
+
+    def test_enum_is_str(self):
+        assert GenerationMethod.from_str("G(N,P)") == "G(n, p)"
+        assert PeriodicType.from_str("io") is PeriodicType.IO
+        with pytest.raises(ValueError):
+            PeriodicType.from_str("Exit")
+
+    def test_immutable(self):
+        compiled = CompiledConfig(Config(get_config_raw()))
+        with pytest.raises(AttributeError):
+            compiled.period = 10  # type: ignore
+        with pytest.raises(AttributeError):
+            compiled.new_attribute = 10  # type: ignore
+        with pytest.raises(AttributeError):
+            del compiled.period
+
+    def test_from_config(self):
+        compiled = CompiledConfig(Config(get_config_raw()))
+        assert CompiledConfig.from_config(compiled) is compiled
+
+    def test_pickle(self):
+        compiled = CompiledConfig(Config(get_config_raw()))
+        loaded = pickle.loads(pickle.dumps(compiled))
+        for name in CompiledConfig.__slots__:
+            assert getattr(loaded, name) == getattr(compiled, name)
@@ -27,3 +27,73 @@ class TestConfig:
         assert combo_config["Properties"] == {
             "End-to-end deadline": {"Ratio of deadline to critical path": [1.0, 1.1]}
         }
+
+    def test_overlay(self):
+        combo_config = get_combo_config()
+        combo_config["Seed"] = 0
+        combo_config["Properties"]["Execution time"] = {"Random": [1, 2, 3]}
+        base_config = Config(combo_config)
+        base_config.optimize()
+
+        config = base_config.overlay(
+            {"Number of nodes": 2, "Ratio of deadline to critical path": 1.5}
+        )
+        assert config.number_of_nodes == 2
+        assert config.ratio_of_deadline_to_critical_path == 1.5
+        assert config.overrides == {
+            "Number of nodes": 2,
+            "Ratio of deadline to critical path": 1.5,
+        }
+        assert config.execution_time is base_config.execution_time
+        assert config.output_formats is base_config.output_formats
+
+        assert base_config.number_of_nodes == 1
+        assert base_config.ratio_of_deadline_to_critical_path == [1.0, 1.1]
+        assert base_config.overrides == {}
+
+    def test_overlay_setter(self):
+        combo_config = get_combo_config()
+        combo_config["Seed"] = 0
+        combo_config["Properties"]["Execution time"] = {"Random": [1, 2, 3]}
+        base_config = Config(combo_config)
+        base_config.optimize()
+        config = base_config.overlay({})
+        sibling_config = base_config.overlay({})
+
+        config.number_of_nodes = 5
+        config.execution_time = [4, 5]
+        config.ratio_of_deadline_to_critical_path = 2.0
+        config.out_degree = 3
+        assert config.number_of_nodes == 5
+        assert config.execution_time == [4, 5]
+        assert config.ratio_of_deadline_to_critical_path == 2.0
+        assert config.out_degree == 3
+
+        for other_config in [base_config, sibling_config]:
+            assert other_config.number_of_nodes == 1
+            assert other_config.execution_time == [1, 2, 3]
+            assert other_config.ratio_of_deadline_to_critical_path == [1.0, 1.1]
+            assert other_config.out_degree is None
+
+    def test_optimize_overlay(self):
+        combo_config = get_combo_config()
+        combo_config["Seed"] = 0
+        base_config = Config(combo_config)
+        config = base_config.overlay({})
+        config.optimize()
+
+        assert config.ratio_of_deadline_to_critical_path == [1.0, 1.1]
+        assert base_config.ratio_of_deadline_to_critical_path == {"Random": [1.0, 1.1]}
+
+    def test_update_param_value_additional(self):
+        combo_config = get_combo_config()
+        combo_config["Seed"] = 0
+        combo_config["Properties"]["Additional properties"] = {
+            "Node properties": {"New node": {"Fixed": 1}}
+        }
+        base_config = Config(combo_config)
+        config = base_config.overlay({})
+        config.update_param_value("New node", {"Fixed": 2})
+
+        assert config.node_properties == {"New node": {"Fixed": 2}}
+        assert base_config.node_properties == {"New node": {"Fixed": 1}}
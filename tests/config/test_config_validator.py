@@ -0,0 +1,77 @@
+import copy
+import glob
+import os
+
+import pytest
+import yaml
+from schema import SchemaError
+
+from src.config import ConfigValidator
+
+SAMPLE_CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "sample_config")
+SAMPLE_CONFIG_PATHS = sorted(glob.glob(os.path.join(SAMPLE_CONFIG_DIR, "*", "*.yaml")))
+
+
+def get_config_raw() -> dict:
+    with open(os.path.join(SAMPLE_CONFIG_DIR, "g_n_p", "sample_g_n_p.yaml")) as f:
+        config_raw = yaml.safe_load(f)
+    return config_raw
+
+
+class TestConfigValidator:
+    @pytest.mark.parametrize("config_path", SAMPLE_CONFIG_PATHS)
+    def test_validate_sample_config(self, config_path):
+        with open(config_path) as f:
+            config_raw = yaml.safe_load(f)
+        ConfigValidator(config_raw).validate()
+
+    def test_validate_long_list(self):
+        config_raw = get_config_raw()
+        config_raw["Properties"]["Execution time"] = {"Random": list(range(1, 100001))}
+        before = copy.deepcopy(config_raw)
+        ConfigValidator(config_raw).validate()
+        assert config_raw == before
+
+    @pytest.mark.parametrize("legacy_grouping", [False, True])
+    def test_validate_legacy_grouping(self, legacy_grouping):
+        config_raw = get_config_raw()
+        config_raw["Properties"]["Legacy grouping"] = legacy_grouping
+        ConfigValidator(config_raw).validate()
+
+        config_raw["Properties"]["Legacy grouping"] = "yes"
+        with pytest.raises(SchemaError):
+            ConfigValidator(config_raw).validate()
+
+    @pytest.mark.parametrize(
+        "option",
+        [
+            {"Random": [1, 2, 3.5]},
+            {"Random": [1.5, 2.5]},
+            {"Combination": [True, False]},
+            {"Fixed": [1]},
+        ],
+    )
+    def test_validate_error_message(self, option):
+        config_raw = get_config_raw()
+        config_raw["Properties"]["Execution time"] = option
+
+        with pytest.raises(SchemaError) as e_schema:
+            ConfigValidator.base_schema.validate(config_raw)
+        with pytest.raises(SchemaError) as e_validator:
+            ConfigValidator(config_raw).validate()
+        assert str(e_validator.value) == str(e_schema.value)
+
+    def test_condense(self):
+        config_raw = {
+            "A": {"Random": [1, 2, 3]},
+            "B": {"Combination": [1, 2.5]},
+            "C": {"Random": "(1, 10, 1)"},
+            "D": [],
+        }
+        assert ConfigValidator._condense(config_raw) == {
+            "A": {"Random": [1]},
+            "B": {"Combination": [1, 2.5]},
+            "C": {"Random": "(1, 10, 1)"},
+            "D": [],
+        }
+        assert config_raw["A"] == {"Random": [1, 2, 3]}
@@ -17,20 +17,35 @@ class TestChain:
         chain = Chain(0)
         number_of_sub_sequence = random.randint(1, 5)
         chain.build_chain(main_sequence_length, number_of_sub_sequence)
+        G = nx.DiGraph()
+        G.add_nodes_from(chain.nodes)
+        G.add_edges_from(chain.edges)
 
-        assert nx.is_directed_acyclic_graph(chain)
-        assert len(list(nx.weakly_connected_components(chain))) == 1
+        assert nx.is_directed_acyclic_graph(G)
+        assert len(list(nx.weakly_connected_components(G))) == 1
         assert chain.main_tail == main_sequence_length - 1
         assert chain.end_idx == chain.number_of_nodes() - 1
+        assert G.number_of_nodes() == chain.number_of_nodes()
+        assert sorted(chain.sub_sequence_tails + [chain.main_tail]) == sorted(
+            Util.get_sink_nodes(G)
+        )
 
         max_len = -1
-        for tail_i in Util.get_sink_nodes(chain):
-            paths = nx.all_simple_paths(chain, 0, tail_i)
+        for tail_i in Util.get_sink_nodes(G):
+            paths = nx.all_simple_paths(G, 0, tail_i)
             for path in paths:
                 if len(path) > max_len:
                     max_len = len(path)
         assert max_len == main_sequence_length
 
+    def test_build_chain_main_sequence_only(self):
+        chain = Chain(3)
+        chain.build_chain(1)
+        assert list(chain.nodes) == [3]
+        assert list(chain.edges) == []
+        assert chain.head == chain.main_tail == chain.end_idx == 3
+        assert chain.sub_sequence_tails == []
+
 
 def get_chains(
     number_of_chains: int, main_sequence_length: int, number_of_sub_sequence: int
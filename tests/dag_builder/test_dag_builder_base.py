@@ -3,8 +3,9 @@ import random
 import networkx as nx
 import pytest
 
-from src.common import Util
+from src.common import DisjointSet, Util
 from src.dag_builder.dag_builder_base import DAGBuilderBase
+from src.exceptions import BuildFailedError
 
 
 class TestDAGBuilderBase:
@@ -101,3 +102,55 @@ class TestDAGBuilderBase:
         G.add_edges_from([(0, 2), (1, 2)])
         DAGBuilderBase._force_create_source_nodes(G, number_of_source_nodes)
         assert len(Util.get_source_nodes(G)) == number_of_source_nodes
+
+    @pytest.mark.parametrize("number_of_nodes", list(range(3, 20)))
+    def test_ensure_weakly_connected_with_components(self, number_of_nodes):
+        G = nx.DiGraph()
+        nodes = [i for i in range(number_of_nodes)]
+        G.add_nodes_from(nodes)
+        components = DisjointSet(nodes)
+        separate_i = random.choice(nodes[1:-1])
+        DAGBuilderBase._add_minimum_edges(nodes[:separate_i], nodes[separate_i:], G, components)
+        assert components.number_of_sets == len(list(nx.weakly_connected_components(G)))
+
+        before_num_entry = len(Util.get_source_nodes(G))
+        before_num_exit = len(Util.get_sink_nodes(G))
+        DAGBuilderBase._ensure_weakly_connected(G, True, True, components)
+        assert nx.is_directed_acyclic_graph(G)
+        assert len(list(nx.weakly_connected_components(G))) == 1
+        assert components.number_of_sets == 1
+        assert before_num_entry == len(Util.get_source_nodes(G))
+        assert before_num_exit == len(Util.get_sink_nodes(G))
+
+    @pytest.mark.parametrize("number_of_isolated_nodes", list(range(1, 6)))
+    def test_ensure_weakly_connected_repair_isolated_nodes(self, number_of_isolated_nodes):
+        G = nx.DiGraph()
+        for middle_i in range(3, 9):
+            G.add_edges_from([(0, middle_i), (1, middle_i), (middle_i, 2)])
+        isolated_nodes = list(range(9, 9 + number_of_isolated_nodes))
+        G.add_nodes_from(isolated_nodes)
+
+        before_num_entry = len(Util.get_source_nodes(G))
+        before_num_exit = len(Util.get_sink_nodes(G))
+        num_repaired = DAGBuilderBase._ensure_weakly_connected(G, True, True)
+        assert num_repaired == number_of_isolated_nodes
+        assert nx.is_directed_acyclic_graph(G)
+        assert len(list(nx.weakly_connected_components(G))) == 1
+        assert before_num_entry == len(Util.get_source_nodes(G))
+        assert before_num_exit == len(Util.get_sink_nodes(G))
+        for node_i in isolated_nodes:
+            assert G.in_degree(node_i) + G.out_degree(node_i) == 1
+
+    @pytest.mark.parametrize("edges", [[(0, 1), (1, 2), (0, 3)], [(0, 2), (1, 2), (2, 3)]])
+    def test_ensure_weakly_connected_repair_infeasible(self, edges):
+        G = nx.DiGraph()
+        G.add_edges_from(edges)
+        G.add_node(4)
+        with pytest.raises(BuildFailedError):
+            DAGBuilderBase._ensure_weakly_connected(G, True, True)
+
+    def test_ensure_weakly_connected_all_isolated_nodes(self):
+        G = nx.DiGraph()
+        G.add_nodes_from(range(3))
+        with pytest.raises(BuildFailedError):
+            DAGBuilderBase._ensure_weakly_connected(G, True, True)
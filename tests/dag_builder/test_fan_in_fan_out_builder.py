@@ -1,6 +1,7 @@
 import random
 
 import networkx as nx
+import numpy as np
 import pytest
 
 from src.common import Util
@@ -134,3 +135,52 @@ class TestFanInFanOutBuilder:
                 assert len(Util.get_source_nodes(dag)) == number_of_source_nodes
         except BuildFailedError:
             return 0
+
+    @pytest.mark.parametrize("number_of_nodes", list(range(3, 60, 3)))
+    def test_build_node_budgeting(self, number_of_nodes):
+        in_degree = random.randint(1, 5)
+        out_degree = random.randint(1, 5)
+        number_of_source_nodes = random.randint(1, 2)
+        config = get_config(number_of_nodes, in_degree, out_degree, number_of_source_nodes)
+        config.graph_structure["Node budgeting"] = True
+        fan_in_fan_out = DAGBuilderFactory.create_instance(config)
+        fan_in_fan_out._max_try = 1  # Budgeting never needs a restart.
+
+        for dag in fan_in_fan_out.build():
+            assert nx.is_directed_acyclic_graph(dag)
+            for node_i in dag.nodes():
+                assert dag.in_degree(node_i) <= in_degree
+                assert dag.out_degree(node_i) <= out_degree
+            assert dag.number_of_nodes() == number_of_nodes
+            assert len(Util.get_source_nodes(dag)) == number_of_source_nodes
+
+    @pytest.mark.parametrize("number_of_nodes, degree", [(30, 3), (50, 3)])
+    def test_build_node_budgeting_number_of_edges(self, number_of_nodes, degree):
+        mean_num_edges = []
+        for node_budgeting in [False, True]:
+            config = get_config(number_of_nodes, degree, degree, 2)
+            config.number_of_dags = 500
+            config.graph_structure["Node budgeting"] = node_budgeting
+            config.set_random_seed()
+            fan_in_fan_out = DAGBuilderFactory.create_instance(config)
+            mean_num_edges.append(
+                np.mean([dag.number_of_edges() for dag in fan_in_fan_out.build()])
+            )
+
+        rejection, budgeting = mean_num_edges
+        assert abs(budgeting - rejection) / rejection < 0.02
+
+    @pytest.mark.parametrize("node_budgeting", [True, False])
+    def test_build_random_source_nodes_over_budget(self, node_budgeting):
+        config = get_config(10, 3, 3, 2)
+        config.graph_structure["Number of source nodes"] = {"Random": [2, 12]}
+        config.graph_structure["Number of sink nodes"] = {"Fixed": 1}
+        config.graph_structure["Node budgeting"] = node_budgeting
+        config.optimize()
+        fan_in_fan_out = DAGBuilderFactory.create_instance(config)
+
+        with pytest.raises(BuildFailedError) as e:
+            for dag in fan_in_fan_out.build():
+                assert dag.number_of_nodes() == 10
+
+        assert "could not be built" in e.value.message
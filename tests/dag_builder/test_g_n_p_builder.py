@@ -4,8 +4,9 @@ import networkx as nx
 import numpy as np
 import pytest
 
+from src.common import Util
 from src.config import Config
-from src.dag_builder import DAGBuilderFactory
+from src.dag_builder import DAGBuilderFactory, GNPBuilder
 from src.exceptions import BuildFailedError, InfeasibleConfigError
 
 
@@ -53,6 +54,73 @@ class TestGNPBuilder:
         except BuildFailedError:
             return 0
 
+    @pytest.mark.parametrize("ensure_weakly_connected", [True, False])
+    def test_build_once_per_dag(self, monkeypatch, ensure_weakly_connected):
+        config_raw = get_config_raw(30, 0.01)
+        config_raw["Graph structure"]["Number of source nodes"] = 2
+        config_raw["Graph structure"]["Number of sink nodes"] = 2
+        config_raw["Graph structure"]["Ensure weakly connected"] = ensure_weakly_connected
+        gnp = DAGBuilderFactory.create_instance(Config(config_raw))
+        num_calls = 0
+        add_random_edges = GNPBuilder._add_random_edges
+
+        def counting_add_random_edges(*args):
+            nonlocal num_calls
+            num_calls += 1
+            add_random_edges(*args)
+
+        monkeypatch.setattr(
+            GNPBuilder, "_add_random_edges", staticmethod(counting_add_random_edges)
+        )
+
+        for dag in gnp.build():
+            assert nx.is_directed_acyclic_graph(dag)
+            assert dag.number_of_nodes() == 30
+            if ensure_weakly_connected:
+                assert nx.is_weakly_connected(dag)
+        assert num_calls == config_raw["Number of DAGs"]
+        assert gnp.num_resampled_dags == 0
+
+    def test_build_repair_isolated_nodes(self, monkeypatch):
+        config_raw = get_config_raw(30, 0.3)
+        config_raw["Graph structure"]["Number of source nodes"] = 2
+        config_raw["Graph structure"]["Number of sink nodes"] = 2
+        gnp = DAGBuilderFactory.create_instance(Config(config_raw))
+
+        # Forced creation connects every node, so the new sink nodes are left isolated
+        # to reach the repair of size 1 components.
+        def add_isolated_sink_nodes(G, number_of_sink_nodes, components=None):
+            new_exits = [G.number_of_nodes() + i for i in range(number_of_sink_nodes)]
+            G.add_nodes_from(new_exits)
+            for new_exit_i in new_exits:
+                components.add(new_exit_i)
+
+        ensure_weakly_connected = GNPBuilder._ensure_weakly_connected
+
+        def checked_ensure_weakly_connected(G, keep_num_entry, keep_num_exit, components):
+            num_entry = len(Util.get_source_nodes(G))
+            num_exit = len(Util.get_sink_nodes(G))
+            num_repaired = ensure_weakly_connected(G, keep_num_entry, keep_num_exit, components)
+            assert num_repaired == 2
+            assert len(Util.get_source_nodes(G)) == num_entry
+            assert len(Util.get_sink_nodes(G)) == num_exit
+            return num_repaired
+
+        monkeypatch.setattr(
+            GNPBuilder, "_force_create_sink_nodes", staticmethod(add_isolated_sink_nodes)
+        )
+        monkeypatch.setattr(
+            GNPBuilder,
+            "_ensure_weakly_connected",
+            staticmethod(checked_ensure_weakly_connected),
+        )
+
+        for dag in gnp.build():
+            assert nx.is_directed_acyclic_graph(dag)
+            assert nx.is_weakly_connected(dag)
+            assert dag.number_of_nodes() == 30
+        assert gnp.num_repaired_dags == config_raw["Number of DAGs"]
+
     def test_build_prob_upper_1(self):
         prob = 1.1
         config_raw = get_config_raw(10, prob)
@@ -64,3 +132,36 @@ class TestGNPBuilder:
                 assert nx.is_directed_acyclic_graph(dag)
         except BuildFailedError:
             return 0
+
+    @pytest.mark.parametrize("prob_edge", [0.0, 0.3, 1.0])
+    def test_add_random_edges(self, prob_edge):
+        num_nodes = 30
+        G = nx.DiGraph()
+        G.add_nodes_from(range(num_nodes))
+        GNPBuilder._add_random_edges(G, num_nodes, prob_edge)
+
+        assert G.number_of_nodes() == num_nodes
+        for src_i, tgt_i in G.edges():
+            assert src_i < tgt_i
+        if prob_edge == 0.0:
+            assert G.number_of_edges() == 0
+        elif prob_edge == 1.0:
+            assert G.number_of_edges() == num_nodes * (num_nodes - 1) // 2
+
+    @pytest.mark.parametrize("num_nodes", [0, 1, 2, 10, 100])
+    @pytest.mark.parametrize("prob_edge", [0.0, 0.001, 0.1, 1.0])
+    def test_sample_edges_sparse(self, num_nodes, prob_edge):
+        src, tgt = GNPBuilder._sample_edges_sparse(num_nodes, prob_edge)
+        edges = set(zip(src.tolist(), tgt.tolist()))
+        assert len(edges) == len(src)
+        for src_i, tgt_i in edges:
+            assert 0 <= src_i < tgt_i < num_nodes
+        if prob_edge == 1.0:
+            assert len(edges) == num_nodes * (num_nodes - 1) // 2
+
+    def test_sample_edges_sparse_small_prob(self):
+        num_nodes = 2000
+        prob_edge = 0.001
+        src, _ = GNPBuilder._sample_edges_sparse(num_nodes, prob_edge)
+        expected = prob_edge * num_nodes * (num_nodes - 1) / 2
+        assert abs(len(src) - expected) < 5 * np.sqrt(expected)
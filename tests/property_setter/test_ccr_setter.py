@@ -1,9 +1,15 @@
 from typing import List
 
+import random
+
 import networkx as nx
+import numpy as np
+import pytest
 
+from src.common import Util
 from src.config import Config
 from src.property_setter.ccr_setter import CCRSetter
+from src.property_setter.property_setter_base import PropertySetterBase
 
 
 def create_sequence(dag: nx.DiGraph, nodes: List[int]) -> None:
@@ -13,13 +19,15 @@ def create_sequence(dag: nx.DiGraph, nodes: List[int]) -> None:
 
 
 class TestRandomSetter:
-    def test_set_by_exec(self, mocker):
+    @pytest.mark.parametrize("legacy_grouping", [False, True])
+    def test_set_by_exec(self, mocker, legacy_grouping):
         ccr = 1.0
         exec_option = list(range(10, 100, 10))
 
         config_mock = mocker.Mock(spec=Config)
         mocker.patch.object(config_mock, "ccr", ccr)
         mocker.patch.object(config_mock, "execution_time", exec_option)
+        mocker.patch.object(config_mock, "legacy_grouping", legacy_grouping)
         setter = CCRSetter(config_mock)
 
         dag = nx.DiGraph()
@@ -42,7 +50,8 @@ class TestRandomSetter:
 
         assert sum_comm / sum_exec - ccr <= 10 ** (-10)
 
-    def test_set_by_comm(self, mocker):
+    @pytest.mark.parametrize("legacy_grouping", [False, True])
+    def test_set_by_comm(self, mocker, legacy_grouping):
         ccr = 1.0
         comm_option = list(range(10, 100, 10))
 
@@ -50,6 +59,7 @@ class TestRandomSetter:
         mocker.patch.object(config_mock, "ccr", ccr)
         mocker.patch.object(config_mock, "execution_time", None)
         mocker.patch.object(config_mock, "communication_time", comm_option)
+        mocker.patch.object(config_mock, "legacy_grouping", legacy_grouping)
         setter = CCRSetter(config_mock)
 
         dag = nx.DiGraph()
@@ -80,6 +90,7 @@ class TestRandomSetter:
         mocker.patch.object(config_mock, "ccr", ccr)
         mocker.patch.object(config_mock, "execution_time", None)
         mocker.patch.object(config_mock, "communication_time", comm_option)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         setter = CCRSetter(config_mock)
 
         dag = nx.DiGraph()
@@ -91,3 +102,29 @@ class TestRandomSetter:
             exec = dag.nodes[node_i]["execution_time"]
             assert isinstance(exec, int)
             assert exec == 1
+
+    @pytest.mark.parametrize("legacy_grouping", [None, False, True])
+    def test_set_legacy_grouping(self, mocker, legacy_grouping):
+        ccr = 2.0
+        exec_option = list(range(10, 100, 10))
+
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "ccr", ccr)
+        mocker.patch.object(config_mock, "execution_time", exec_option)
+        mocker.patch.object(config_mock, "legacy_grouping", legacy_grouping)
+        setter = CCRSetter(config_mock)
+
+        dag = nx.DiGraph()
+        create_sequence(dag, list(range(0, 30)))
+
+        random.seed(0)
+        np.random.seed(0)
+        setter.set(dag)
+
+        random.seed(0)
+        np.random.seed(0)
+        execs = Util.random_choices(exec_option, dag.number_of_nodes())
+        expected = PropertySetterBase._grouping(
+            int(ccr * sum(execs)), dag.number_of_edges(), legacy=bool(legacy_grouping)
+        )
+        assert [dag.edges[e]["communication_time"] for e in dag.edges] == expected
@@ -33,6 +33,18 @@ class TestRandomSetter:
         cp_len = DeadlineSetter._get_cp_len(dag, entry_i, exit_i)
         assert cp_len == 5
 
+    def test_get_cp_len_with_comm(self):
+        dag = nx.DiGraph()
+        dag.add_nodes_from(range(4), execution_time=1)
+        dag.add_edge(0, 1, communication_time=5)
+        dag.add_edge(0, 2, communication_time=1)
+        dag.add_edge(1, 3, communication_time=0)
+        dag.add_edge(2, 3, communication_time=2)
+
+        assert DeadlineSetter._get_cp_len(dag, 0, 3) == 8
+        assert DeadlineSetter._get_cp_len(dag, 1, 2) == 0
+        assert DeadlineSetter._get_cp_len(dag, 3, 3) == 0
+
     def test_set(self, mocker):
         ratio = 1.1
 
@@ -58,3 +70,18 @@ class TestRandomSetter:
 
         setter.set(dag)
         assert dag.nodes[exit_i]["end_to_end_deadline"] == int(5 * ratio)
+
+    def test_set_multiple_sources(self, mocker):
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "ratio_of_deadline_to_critical_path", 1.0)
+        setter = DeadlineSetter(config_mock)
+
+        dag = nx.DiGraph()
+        dag.add_nodes_from(range(6), execution_time=2)
+        dag.add_edges_from([(0, 2), (1, 2), (2, 3), (1, 4)])
+        dag.edges[1, 2]["communication_time"] = 3
+
+        setter.set(dag)
+        assert dag.nodes[3]["end_to_end_deadline"] == 9
+        assert dag.nodes[4]["end_to_end_deadline"] == 4
+        assert dag.nodes[5]["end_to_end_deadline"] == 0  # Isolated node
@@ -0,0 +1,55 @@
+import networkx as nx
+import numpy as np
+
+from src.common import Util
+from src.config import Config
+from src.property_setter.fused_random_setter import FusedRandomSetter
+
+
+class TestFusedRandomSetter:
+    def test_set(self, mocker):
+        exec_option = list(range(10, 100, 10))
+        comm_option = [1, 2, 3]
+        node_new_option = [0.5, 1.5]
+
+        config_mock = mocker.Mock(spec=Config)
+        setter = FusedRandomSetter(
+            config_mock,
+            [
+                ("node", "execution_time", exec_option),
+                ("edge", "communication_time", comm_option),
+                ("node", "Node new", node_new_option),
+            ],
+        )
+        dag = nx.DiGraph()
+        dag.add_nodes_from(list(range(0, 30)))
+        dag.add_edges_from([(i, i + 1) for i in range(29)])
+
+        setter.set(dag)
+
+        for node_i in dag.nodes:
+            assert dag.nodes[node_i]["execution_time"] in exec_option
+            assert dag.nodes[node_i]["Node new"] in node_new_option
+        for src_i, tgt_i in dag.edges:
+            assert dag.edges[src_i, tgt_i]["communication_time"] in comm_option
+
+    def test_set_same_sequence(self, mocker):
+        exec_option = list(range(10, 100, 10))
+        comm_option = [1, 2, 3]
+
+        config_mock = mocker.Mock(spec=Config)
+        setter = FusedRandomSetter(
+            config_mock,
+            [("node", "execution_time", exec_option), ("edge", "communication_time", comm_option)],
+        )
+        dag = nx.DiGraph()
+        dag.add_edges_from([(i, i + 1) for i in range(29)])
+
+        np.random.seed(0)
+        setter.set(dag)
+        np.random.seed(0)
+        execs = Util.random_choices(exec_option, dag.number_of_nodes())
+        comms = Util.random_choices(comm_option, dag.number_of_edges())
+
+        assert [dag.nodes[node_i]["execution_time"] for node_i in dag.nodes] == execs
+        assert [dag.edges[edge]["communication_time"] for edge in dag.edges] == comms
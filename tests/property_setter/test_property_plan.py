@@ -0,0 +1,102 @@
+import networkx as nx
+
+from src.config import Config
+from src.property_setter import (
+    CCRSetter,
+    DeadlineSetter,
+    FusedRandomSetter,
+    PropertySetterFactory,
+    UtilizationSetter,
+)
+
+
+def get_config_raw(properties: dict) -> dict:
+    config_raw = {
+        "Seed": 0,
+        "Number of DAGs": 1,
+        "Graph structure": {
+            "Generation method": "G(n, p)",
+            "Probability of edge existence": 0.5,
+            "Number of nodes": 10,
+        },
+        "Properties": properties,
+        "Output formats": {"DAG": {"YAML": True}},
+    }
+    return config_raw
+
+
+class TestPropertyPlan:
+    def test_create_property_plan_fused(self):
+        config = Config(
+            get_config_raw(
+                {
+                    "Execution time": {"Random": [1, 2, 3]},
+                    "Communication time": {"Random": [4, 5]},
+                    "End-to-end deadline": {"Ratio of deadline to critical path": 1.5},
+                    "Additional properties": {"Node properties": {"Weight": [1, 2]}},
+                }
+            )
+        )
+        config.optimize()
+        plan = PropertySetterFactory.create_property_plan(config)
+
+        assert len(plan) == 3
+        assert isinstance(plan.setters[0], FusedRandomSetter)
+        assert [attr[:2] for attr in plan.setters[0].attributes] == [
+            ("node", "execution_time"),
+            ("edge", "communication_time"),
+        ]
+        assert isinstance(plan.setters[1], DeadlineSetter)
+        assert isinstance(plan.setters[2], FusedRandomSetter)
+        assert [attr[:2] for attr in plan.setters[2].attributes] == [("node", "Weight")]
+
+        dag = nx.DiGraph()
+        dag.add_edges_from([(0, 1), (1, 2), (0, 2)])
+        plan.set(dag)
+        for node_i in dag.nodes:
+            assert dag.nodes[node_i]["execution_time"] in [1, 2, 3]
+            assert dag.nodes[node_i]["Weight"] in [1, 2]
+        assert dag.nodes[2]["end_to_end_deadline"] > 0
+
+    def test_create_property_plan_ccr_skips_execution_time(self):
+        config = Config(
+            get_config_raw(
+                {
+                    "Execution time": {"Random": [1, 2, 3]},
+                    "CCR": {"Fixed": 1.0},
+                }
+            )
+        )
+        config.optimize()
+        plan = PropertySetterFactory.create_property_plan(config)
+
+        assert len(plan) == 1
+        assert isinstance(plan.setters[0], CCRSetter)
+
+    def test_create_property_plan_multi_rate_with_ccr(self):
+        config = Config(
+            get_config_raw(
+                {
+                    "Multi-rate": {
+                        "Periodic type": "All",
+                        "Period": {"Random": [10, 20]},
+                        "Total utilization": {"Fixed": 1.0},
+                    },
+                    "Communication time": {"Random": [4, 5]},
+                    "CCR": {"Fixed": 1.0},
+                }
+            )
+        )
+        config.optimize()
+        plan = PropertySetterFactory.create_property_plan(config)
+
+        assert len(plan) == 2
+        assert isinstance(plan.setters[0], UtilizationSetter)
+        assert isinstance(plan.setters[1], CCRSetter)
+
+        dag = nx.DiGraph()
+        dag.add_edges_from([(0, 1), (1, 2), (0, 2)])
+        plan.set(dag)
+        for node_i in dag.nodes:
+            assert dag.nodes[node_i]["period"] in [10, 20]
+            assert dag.nodes[node_i]["execution_time"] >= 1
@@ -6,14 +6,15 @@ from src.property_setter.property_setter_base import PropertySetterBase
 
 
 class TestPropertySetterBase:
+    @pytest.mark.parametrize("legacy", [False, True])
     @pytest.mark.parametrize("sum", list(range(1, 30)))
-    def test_grouping_normal(self, sum):
+    def test_grouping_normal(self, sum, legacy):
         if sum == 1:
             num_groups = 1
         else:
             num_groups = random.randint(1, sum)
 
-        grouping = PropertySetterBase._grouping(sum, num_groups)
+        grouping = PropertySetterBase._grouping(sum, num_groups, legacy)
         assert len(grouping) == num_groups
         after_sum = 0
         for v in grouping:
@@ -24,3 +25,13 @@ class TestPropertySetterBase:
 
     def test_grouping_infeasible(self):
         assert not PropertySetterBase._grouping(1, 10)
+        assert not PropertySetterBase._grouping(1, 10, legacy=True)
+
+    def test_grouping_all_size_1(self):
+        assert PropertySetterBase._grouping(10, 10) == [1] * 10
+        assert PropertySetterBase._grouping(10, 10, legacy=True) == [1] * 10
+
+    def test_grouping_large_sum(self):
+        grouping = PropertySetterBase._grouping(10**12, 5)
+        assert len(grouping) == 5
+        assert sum(grouping) == 10**12
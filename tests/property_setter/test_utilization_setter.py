@@ -2,10 +2,13 @@ import random
 from typing import List
 
 import networkx as nx
+import numpy as np
 import pytest
 
+from src.common import OptionRange
 from src.config import Config
 from src.dag_builder.chain_based_builder import Chain, ChainBasedDAG
+from src.exceptions import InfeasibleConfigError
 from src.property_setter.utilization_setter import UtilizationSetter
 
 
@@ -33,6 +36,8 @@ class TestUtilizationSetter:
         mocker.patch.object(config_mock, "period", period_option)
         mocker.patch.object(config_mock, "source_node_period", None)
         mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         mocker.patch.object(config_mock, "periodic_type", "All")
         util_setter = UtilizationSetter(config_mock)
         dag = nx.DiGraph()
@@ -57,6 +62,8 @@ class TestUtilizationSetter:
         mocker.patch.object(config_mock, "period", period_option)
         mocker.patch.object(config_mock, "source_node_period", None)
         mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         mocker.patch.object(config_mock, "periodic_type", "All")
         util_setter = UtilizationSetter(config_mock)
         dag = nx.DiGraph()
@@ -77,6 +84,8 @@ class TestUtilizationSetter:
         mocker.patch.object(config_mock, "period", period_option)
         mocker.patch.object(config_mock, "source_node_period", None)
         mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         mocker.patch.object(config_mock, "periodic_type", "Chain")
         util_setter = UtilizationSetter(config_mock)
 
@@ -97,6 +106,118 @@ class TestUtilizationSetter:
                 sum_exec += exec
             assert sum_exec / chain_period <= max_utilization
 
+    def test_set_only_period(self, mocker):
+        period_option = list(range(10, 100, 10))
+
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "total_utilization", 1.0)
+        mocker.patch.object(config_mock, "period", period_option)
+        mocker.patch.object(config_mock, "source_node_period", None)
+        mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
+        mocker.patch.object(config_mock, "periodic_type", "Entry")
+        util_setter = UtilizationSetter(config_mock, set_execution_time=False)
+        dag = nx.DiGraph()
+        dag.add_edges_from([(0, 2), (1, 2), (2, 3)])
+
+        util_setter.set(dag)
+
+        for node_i in dag.nodes():
+            assert "execution_time" not in dag.nodes[node_i]
+            if node_i in [0, 1]:
+                assert dag.nodes[node_i]["period"] in period_option
+            else:
+                assert "period" not in dag.nodes[node_i]
+
+    @pytest.mark.parametrize("maximum_hyperperiod", [120, [60, 120, 180]])
+    def test_set_maximum_hyperperiod(self, mocker, maximum_hyperperiod):
+        period_option = [7, 10, 12, 15, 20, 25, 30, 40, 45, 60]
+        source_node_period_option = [5, 11, 60]
+
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "total_utilization", 1.0)
+        mocker.patch.object(config_mock, "maximum_utilization", None)
+        mocker.patch.object(config_mock, "utilization_method", None)
+        mocker.patch.object(config_mock, "period", period_option)
+        mocker.patch.object(config_mock, "source_node_period", source_node_period_option)
+        mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", maximum_hyperperiod)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
+        mocker.patch.object(config_mock, "periodic_type", "All")
+        mocker.patch.object(config_mock, "execution_time", 1)
+        util_setter = UtilizationSetter(config_mock)
+
+        bounds = maximum_hyperperiod if isinstance(maximum_hyperperiod, list) else [120]
+        for _ in range(20):
+            dag = nx.DiGraph()
+            dag.add_edges_from([(0, 2), (1, 2), (2, 3), (3, 4)])
+            util_setter.set(dag)
+
+            periods = [dag.nodes[node_i]["period"] for node_i in dag.nodes]
+            assert dag.graph["hyperperiod"] == np.lcm.reduce(periods)
+            assert any(bound % dag.graph["hyperperiod"] == 0 for bound in bounds)
+            for node_i in dag.nodes:
+                assert dag.nodes[node_i]["period"] in (
+                    source_node_period_option if node_i in [0, 1] else period_option
+                )
+                assert dag.nodes[node_i]["period"] not in [7, 11]
+
+    def test_set_maximum_hyperperiod_infeasible(self, mocker):
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "period", [7, 10])
+        mocker.patch.object(config_mock, "source_node_period", None)
+        mocker.patch.object(config_mock, "sink_node_period", [11, 13])
+        mocker.patch.object(config_mock, "maximum_hyperperiod", 100)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
+
+        with pytest.raises(InfeasibleConfigError):
+            UtilizationSetter(config_mock)
+
+    @pytest.mark.parametrize(
+        "start, stop, step, bound",
+        [
+            (1.0, 30.0, 1.0, 120),
+            (1.0, 10.0, 3.0, 120),
+            (200.0, 2.0, -2.0, 360),
+            (5.0, 1000.0, 5.0, 7),
+            (7.0, 7.0, 1.0, 49),
+        ],
+    )
+    def test_get_divisor_option_range(self, start, stop, step, bound):
+        option = OptionRange(start, stop, step)
+        expected = [period for period in list(option) if bound % period == 0]
+        if expected:
+            assert UtilizationSetter._get_divisor_option(option, bound) == expected
+        else:
+            with pytest.raises(InfeasibleConfigError):
+                UtilizationSetter._get_divisor_option(option, bound)
+
+    def test_get_divisor_option_large_range(self):
+        option = OptionRange(1.0, 1e15, 1.0)
+        divisors = UtilizationSetter._get_divisor_option(option, 720720)
+        assert divisors == [d for d in range(1, 720721) if 720720 % d == 0]
+
+    def test_set_without_maximum_hyperperiod(self, mocker):
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "total_utilization", 1.0)
+        mocker.patch.object(config_mock, "maximum_utilization", None)
+        mocker.patch.object(config_mock, "utilization_method", None)
+        mocker.patch.object(config_mock, "period", [7, 11])
+        mocker.patch.object(config_mock, "source_node_period", None)
+        mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
+        mocker.patch.object(config_mock, "periodic_type", "All")
+        mocker.patch.object(config_mock, "execution_time", 1)
+        util_setter = UtilizationSetter(config_mock)
+        dag = nx.DiGraph()
+        dag.add_edges_from([(0, 1)])
+
+        util_setter.set(dag)
+
+        assert "hyperperiod" not in dag.graph
+
     @pytest.mark.parametrize("n", list(range(1, 30)))
     def test_UUniFast(self, n):
         total_utilization = random.uniform(0.1, n)
@@ -123,6 +244,106 @@ class TestUtilizationSetter:
             sum_util += util
         assert abs(sum_util - total_utilization) <= 0.000001
 
+    @pytest.mark.parametrize("n", list(range(1, 30)))
+    def test_UUniFast_vectorized(self, n):
+        total_utilization = random.uniform(0.1, n)
+        uniforms = np.random.random_sample((3, n - 1))
+        utilizations = UtilizationSetter._UUniFast_vectorized(total_utilization, uniforms)
+
+        assert utilizations.shape == (3, n)
+        assert (utilizations >= 0.0).all()
+        assert np.allclose(utilizations.sum(axis=1), total_utilization)
+
+    def test_draw_uniforms(self, mocker):
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
+        util_setter = UtilizationSetter(config_mock)
+        mocker.patch.object(util_setter, "_UNIFORM_BLOCK_SIZE", 10)
+
+        np.random.seed(0)
+        uniforms = np.concatenate([util_setter._draw_uniforms(size) for size in [3, 6, 4, 25]])
+        np.random.seed(0)
+        expected = np.concatenate([np.random.random_sample(10), np.random.random_sample(28)])
+        assert np.array_equal(uniforms, expected)
+
+    @pytest.mark.parametrize("size", [0, -1])
+    def test_draw_uniforms_empty(self, mocker, size):
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
+        util_setter = UtilizationSetter(config_mock)
+        mocker.patch.object(util_setter, "_UNIFORM_BLOCK_SIZE", 10)
+
+        np.random.seed(0)
+        util_setter._draw_uniforms(3)
+        buffer = util_setter._uniforms
+
+        uniforms = util_setter._draw_uniforms(size)
+        assert uniforms.size == 0
+        assert util_setter._uniform_idx == 3
+        assert util_setter._uniforms is buffer
+
+        np.random.seed(0)
+        assert np.array_equal(util_setter._draw_uniforms(7), np.random.random_sample(10)[3:])
+
+    @pytest.mark.parametrize("n", list(range(1, 30)))
+    def test_RandFixedSum(self, n):
+        total_utilization = random.uniform(0.1, n)
+        utilizations = UtilizationSetter._RandFixedSum(total_utilization, n)
+
+        assert len(utilizations) == n
+        for util in utilizations:
+            assert util >= 0.0
+        assert abs(sum(utilizations) - total_utilization) <= 0.000001
+
+    @pytest.mark.parametrize("n", list(range(1, 30)))
+    def test_RandFixedSum_with_max_u(self, n):
+        max_utilization = 1.0
+        total_utilization = random.uniform(0.1, n) * 0.999
+        utilizations = UtilizationSetter._RandFixedSum(total_utilization, n, max_utilization)
+
+        assert len(utilizations) == n
+        for util in utilizations:
+            assert 0.0 <= util <= max_utilization + 0.000001
+        assert abs(sum(utilizations) - total_utilization) <= 0.000001
+
+    def test_RandFixedSum_infeasible(self):
+        assert UtilizationSetter._RandFixedSum(3.0, 2, 1.0) == [1.0, 1.0]
+
+    @pytest.mark.parametrize("utilization_method", ["UUniFast", "RandFixedSum"])
+    def test_set_by_total_utilization_method(self, mocker, utilization_method):
+        max_utilization = 0.5
+        total_utilization = 14.0
+        period_option = list(range(1000, 10000, 10))
+
+        config_mock = mocker.Mock(spec=Config)
+        mocker.patch.object(config_mock, "total_utilization", total_utilization)
+        mocker.patch.object(config_mock, "maximum_utilization", max_utilization)
+        mocker.patch.object(config_mock, "utilization_method", utilization_method)
+        mocker.patch.object(config_mock, "period", period_option)
+        mocker.patch.object(config_mock, "source_node_period", None)
+        mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
+        mocker.patch.object(config_mock, "periodic_type", "All")
+        util_setter = UtilizationSetter(config_mock)
+        dag = nx.DiGraph()
+        dag.add_nodes_from(list(range(0, 30)))
+
+        util_setter._set_by_total_utilization(dag)
+
+        after_total_util = 0
+        for node_i in dag.nodes():
+            assert dag.nodes[node_i]["period"] in period_option
+            assert dag.nodes[node_i]["execution_time"] >= 1
+            util = dag.nodes[node_i]["execution_time"] / dag.nodes[node_i]["period"]
+            assert util <= max_utilization
+            after_total_util += util
+        assert abs(after_total_util - total_utilization) <= 0.05
+
     def test_set_by_total_utilization_no_max(self, mocker):
         total_utilization = 10.0
         period_option = list(range(1000, 10000, 10))
@@ -133,6 +354,8 @@ class TestUtilizationSetter:
         mocker.patch.object(config_mock, "period", period_option)
         mocker.patch.object(config_mock, "source_node_period", None)
         mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         mocker.patch.object(config_mock, "periodic_type", "All")
         util_setter = UtilizationSetter(config_mock)
         dag = nx.DiGraph()
@@ -159,6 +382,8 @@ class TestUtilizationSetter:
         mocker.patch.object(config_mock, "period", period_option)
         mocker.patch.object(config_mock, "source_node_period", None)
         mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         mocker.patch.object(config_mock, "periodic_type", "All")
         util_setter = UtilizationSetter(config_mock)
         dag = nx.DiGraph()
@@ -188,6 +413,8 @@ class TestUtilizationSetter:
         mocker.patch.object(config_mock, "period", period_option)
         mocker.patch.object(config_mock, "source_node_period", None)
         mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         mocker.patch.object(config_mock, "periodic_type", "All")
         util_setter = UtilizationSetter(config_mock)
         dag = nx.DiGraph()
@@ -212,6 +439,8 @@ class TestUtilizationSetter:
         mocker.patch.object(config_mock, "period", period_option)
         mocker.patch.object(config_mock, "source_node_period", None)
         mocker.patch.object(config_mock, "sink_node_period", None)
+        mocker.patch.object(config_mock, "maximum_hyperperiod", None)
+        mocker.patch.object(config_mock, "legacy_grouping", None)
         mocker.patch.object(config_mock, "periodic_type", "Chain")
         util_setter = UtilizationSetter(config_mock)
 